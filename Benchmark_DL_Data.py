@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import argparse
+import contextlib
+import csv
+import io
+import math
+import os
+import tempfile
+import time
+import tracemalloc
+
+import Generate_DL_Data as gen
+import Process_DL_Data as dl
+
+WIDE_TABLES = ('CharaData', 'QuestData', 'WeaponBody', 'AbilityData', 'SkillData')
+READ_COLUMNS = ('_Id', '_Name', '_EntriesKey')
+LABEL_LOOKUPS = 200000
+SCALES = (1, 10, 100)
+SCALING_TOP_N = 25
+# Time growing faster than rows read to this power is reported as super-linear
+SUPER_LINEAR_EXPONENT = 1.2
+
+def dict_row_factory(cursor, row):
+    # What row_factory returned before rows became dl.Row: a fresh dict per row
+    return {col[0]: value if value is None or type(value) is str else str(value)
+            for col, value in zip(cursor.description, row)}
+
+def measure(con, table, factory, repeat):
+    """Best time to fetch every row of a table and read a few fields, and the peak memory of holding them."""
+    con.row_factory = factory
+    query = f'SELECT * FROM {table}'
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in con.execute(query).fetchall():
+            for column in READ_COLUMNS:
+                if column in row:
+                    row[column]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    rows = con.execute(query).fetchall()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return len(rows), best, peak
+
+def benchmark_rows(in_dir, tables, repeat):
+    mono_db = dl.MonoDatabase(in_dir)
+    mono_db.sync()
+    print('{:<16} {:>8} {:>12} {:>12} {:>12} {:>12}'.format(
+        'Table', 'Rows', 'dict ms', 'Row ms', 'dict KiB', 'Row KiB'))
+    for table in tables:
+        if not mono_db.has_table(table):
+            continue
+        mono_db.load_table(table, mono_db.sources[table])
+        count, dict_time, dict_peak = measure(mono_db.con, table, dict_row_factory, repeat)
+        _, row_time, row_peak = measure(mono_db.con, table, dl.row_factory, repeat)
+        print('{:<16} {:>8} {:>12.2f} {:>12.2f} {:>12.1f} {:>12.1f}'.format(
+            table, count, dict_time * 1000, row_time * 1000, dict_peak / 1024, row_peak / 1024))
+
+def dict_get_label(text_label_dict, key, lang='en'):
+    # What get_label did before labels were normalized once at load time
+    try:
+        txt_label = text_label_dict[lang]
+    except KeyError:
+        txt_label = text_label_dict['en']
+    return (txt_label.get(key, dl.DEFAULT_TEXT_LABEL) or dl.DEFAULT_TEXT_LABEL).replace('\\n', ' ')
+
+def benchmark_labels(in_dir, repeat):
+    """Time of LABEL_LOOKUPS get_label calls, cycling over every key, against a plain dict of all labels."""
+    path = in_dir + dl.TEXT_LABEL + dl.EXT
+    with open(path, encoding='utf-8', newline='') as in_file:
+        labels = {row['_Id']: row['_Text'] for row in csv.DictReader(in_file, dialect='excel-tab')}
+    keys = list(labels)
+    lookups = [keys[idx % len(keys)] for idx in range(LABEL_LOOKUPS)]
+    dl.TEXT_LABEL_DICT = dl.TextLabels({'en': path})
+
+    def best_of(func):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for key in lookups:
+                func(key)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    text_label_dict = {'en': labels}
+    dict_time = best_of(lambda key: dict_get_label(text_label_dict, key))
+    store_time = best_of(lambda key: dl.get_label(key))
+    print('{:<16} {:>8} {:>12} {:>12}'.format('Labels', 'Lookups', 'dict ms', 'get_label ms'))
+    print('{:<16} {:>8} {:>12.2f} {:>12.2f}'.format(dl.TEXT_LABEL, LABEL_LOOKUPS, dict_time * 1000, store_time * 1000))
+
+def growth_exponent(first, last):
+    """How time grew relative to rows read between two runs of a processor, 1.0 being linear."""
+    if not first['rows_in'] or last['rows_in'] <= first['rows_in'] or not first['wall_seconds']:
+        return None
+    return math.log(last['wall_seconds'] / first['wall_seconds']) / math.log(last['rows_in'] / first['rows_in'])
+
+def benchmark_scaling(scales, seed):
+    """Runs every processor against synthetic dumps of each scale and compares their times."""
+    reports = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in scales:
+            in_dir = os.path.join(tmp_dir, 'in-{}'.format(scale))
+            start = time.perf_counter()
+            gen.generate(output_dir=in_dir, scale=scale, seed=seed)
+            generated = time.perf_counter() - start
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                dl.process(input_dir=in_dir, output_dir=os.path.join(tmp_dir, 'out-{}'.format(scale)))
+            print('Scale {:g}: generated in {:.1f}s, processed in {:.1f}s'.format(scale, generated, time.perf_counter() - start))
+            reports[scale] = dict(dl.PROCESSOR_REPORT)
+
+    first, last = reports[scales[0]], reports[scales[-1]]
+    print(('{:<36}' + ' {:>10}' * len(scales) + ' {:>8}').format(
+        'Processor', *['{:g}x ms'.format(scale) for scale in scales], 'Growth'))
+    for name in sorted(last, key=lambda name: -last[name]['wall_seconds'])[:SCALING_TOP_N]:
+        exponent = growth_exponent(first[name], last[name]) if name in first else None
+        print(('{:<36}' + ' {:>10.1f}' * len(scales) + ' {:>8}').format(
+            name, *[reports[scale][name]['wall_seconds'] * 1000 if name in reports[scale] else 0 for scale in scales],
+            '-' if exponent is None else '{:.2f}{}'.format(exponent, ' !' if exponent > SUPER_LINEAR_EXPONENT else '')))
+
+BENCHMARKS = {
+    'rows': lambda args, in_dir: benchmark_rows(in_dir, args.tables, args.repeat),
+    'labels': lambda args, in_dir: benchmark_labels(in_dir, args.repeat),
+    'scaling': lambda args, in_dir: benchmark_scaling(args.scales, args.seed),
+}
+# scaling generates its own dumps and takes a while, so it only runs when asked for
+DEFAULT_BENCHMARKS = ['rows', 'labels']
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark parts of Process_DL_Data against a mono dump.')
+    parser.add_argument('-i', type=str, help='directory of input text files', default='./')
+    parser.add_argument('--benchmarks', type=str, nargs='+', choices=BENCHMARKS, help='benchmarks to run (default: rows labels)', default=DEFAULT_BENCHMARKS)
+    parser.add_argument('--tables', type=str, nargs='+', help='tables to fetch (default: the widest commonly queried ones)', default=WIDE_TABLES)
+    parser.add_argument('--scales', type=float, nargs='+', help='synthetic dump sizes for the scaling benchmark (default: 1 10 100)', default=SCALES)
+    parser.add_argument('--seed', type=int, help='random seed of the synthetic dumps (default: 0)', default=0)
+    parser.add_argument('--repeat', type=int, help='runs per measurement, the best one is reported', default=5)
+
+    args = parser.parse_args()
+    in_dir = args.i if args.i[-1] == '/' else args.i+'/'
+    for name in args.benchmarks:
+        BENCHMARKS[name](args, in_dir)
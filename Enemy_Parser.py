@@ -6,6 +6,8 @@ import csv
 import os
 import re
 
+from Process_DL_Data import LabelStore
+
 QUEST_NAME_REGEX = {
     re.compile(r'TUTORIAL_'): (lambda: 'Prologue'),
     re.compile(r'MAIN_(\d+)_(\d+)_E_'):
@@ -312,7 +314,7 @@ def parse(input_dir, output_dir='', text_label_dict=None):
     if text_label_dict:
         TEXT_LABEL = text_label_dict
     else:
-        TEXT_LABEL = csv_to_dict(os.path.join(input_dir, 'TextLabel.txt'), index='_Id', value_key='_Text', tabs=True)
+        TEXT_LABEL = LabelStore.build(os.path.join(input_dir, 'TextLabel.txt'))
 
     enemies_set = set()
     enemies_output = []
@@ -0,0 +1,1284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+    Generate_DL_Data.py
+    Writes a synthetic, schema-faithful mono dump that Process_DL_Data.py can
+    run against, so the pipeline can be benchmarked without the game data.
+"""
+
+import argparse
+import csv
+import os
+import random
+
+from collections import OrderedDict
+
+EXT = '.txt'
+DATE_FMT = '{:04d}/{:02d}/{:02d} {:02d}:00:00'
+
+# Entity types (GiftType.cs) and the table their ids are drawn from.
+ENTITY_TABLES = {
+    '1': 'CharaData',
+    '2': 'UseItem',
+    '3': 'WeaponBody',
+    '4': None,
+    '7': 'DragonData',
+    '8': 'MaterialData',
+    '9': 'FortPlantData',
+    '10': 'EmblemData',
+    '11': 'StampData',
+    '12': 'AbilityCrest',
+    '14': None,
+    '15': 'DragonGiftData',
+    '18': None,
+    '20': 'RaidEventItem',
+    '22': 'BuildEventItem',
+    '23': None,
+    '24': 'CollectEventItem',
+    '25': 'Clb01EventItem',
+    '26': 'AstralItem',
+    '29': 'ExRushEventItem',
+    '30': 'SimpleEventItem',
+    '32': 'ExHunterEventItem',
+    '33': 'GatherItem',
+    '34': 'CombatEventItem',
+    '37': 'WeaponSkin',
+    '39': 'AbilityCrest',
+    '40': 'EarnEventItem',
+    '41': 'TalismanData',
+    '42': 'DmodePoint',
+    '43': 'DmodeDungeonItemData',
+}
+REWARD_ENTITY_TYPES = tuple(ENTITY_TABLES)
+
+
+class Context:
+    def __init__(self, rng, ids, labels):
+        self.rng = rng
+        self.ids = ids
+        self.labels = labels
+        self.index = 0
+        self.count = 0
+        self.row = None
+
+    def pick(self, table):
+        return self.rng.choice(self.ids[table]) if self.ids[table] else '0'
+
+
+# Column value specs: each is a callable taking the generation Context.
+def seq(start, step=1):
+    return lambda ctx: str(start + ctx.index * step)
+
+def const(value):
+    return lambda ctx: value
+
+def num(lo, hi):
+    return lambda ctx: str(ctx.rng.randint(lo, hi))
+
+def real(lo, hi, digits=1):
+    return lambda ctx: str(round(ctx.rng.uniform(lo, hi), digits))
+
+def pick(*values):
+    return lambda ctx: ctx.rng.choice(values)
+
+def ref(table, zero_rate=0.0):
+    def _ref(ctx):
+        if zero_rate and ctx.rng.random() < zero_rate:
+            return '0'
+        return ctx.pick(table)
+    return _ref
+
+def ref_tail(table, size):
+    """Like ref(), but only draws from the last size(count) ids of the table."""
+    def _ref_tail(ctx):
+        table_ids = ctx.ids[table]
+        return ctx.rng.choice(table_ids[-size(len(table_ids)):])
+    return _ref_tail
+
+def same(column, prefix='', suffix=''):
+    return lambda ctx: prefix + ctx.row[column] + suffix
+
+def date(year_lo=2018, year_hi=2022):
+    return lambda ctx: DATE_FMT.format(ctx.rng.randint(year_lo, year_hi), ctx.rng.randint(1, 12),
+                                       ctx.rng.randint(1, 28), ctx.rng.randint(0, 23))
+
+def label(prefix, text=None, key_column='_Id'):
+    """Returns a TextLabel key built from the row's id and registers its text."""
+    def _label(ctx):
+        key = prefix + ctx.row[key_column]
+        ctx.labels[key] = (text or '{prefix}{id}').format(
+            prefix=prefix.title().replace('_', ' '), id=ctx.row[key_column], n=ctx.index)
+        return key
+    return _label
+
+def labelled(spec, prefix, text):
+    """Keeps the value produced by spec, but registers a label for prefix+value."""
+    def _labelled(ctx):
+        value = spec(ctx)
+        ctx.labels[prefix + value] = text.format(id=value, n=ctx.index)
+        return value
+    return _labelled
+
+def entity_type(types=REWARD_ENTITY_TYPES):
+    return lambda ctx: ctx.rng.choice(types)
+
+def entity_id(type_column):
+    def _entity_id(ctx):
+        table = ENTITY_TABLES.get(ctx.row[type_column])
+        return ctx.pick(table) if table else '0'
+    return _entity_id
+
+def entities(prefix, count, types=REWARD_ENTITY_TYPES, type_key='EntityType',
+             id_key='EntityId', quantity_key='EntityQuantity'):
+    columns = []
+    for i in range(1, count + 1):
+        suffix = str(i) if count > 1 else ''
+        columns.extend([
+            (f'{prefix}{type_key}{suffix}', entity_type(types)),
+            (f'{prefix}{id_key}{suffix}', entity_id(f'{prefix}{type_key}{suffix}')),
+            (f'{prefix}{quantity_key}{suffix}', num(1, 5000)),
+        ])
+    return columns
+
+def numbered(template, lo, hi, spec):
+    return [(template.format(i), spec) for i in range(lo, hi + 1)]
+
+def item_table(start, name_prefix, extra=()):
+    return {
+        'count': 20,
+        'columns': [
+            ('_Id', seq(start)),
+            ('_Name', label(name_prefix)),
+            ('_Detail', label(name_prefix + 'DETAIL_')),
+            ('_Description', label(name_prefix + 'DESCRIPTION_')),
+            *extra,
+            *numbered('_MoveQuest{}', 1, 5, const('0')),
+            ('_PouchRarity', num(1, 5)),
+        ],
+    }
+
+def generic_table(start, count, extra=()):
+    return {
+        'count': count,
+        'columns': [
+            ('_Id', seq(start)),
+            ('_EntriesKey', seq(start)),
+            *extra,
+            ('_Value', num(0, 100)),
+            ('_Flag', pick('0', '1')),
+        ],
+    }
+
+def kv_table(start, count, extra=()):
+    return {
+        'count': count,
+        'columns': [
+            ('_Id', seq(start)),
+            *extra,
+            ('_Text', label('KV_TEXT_' + str(start) + '_')),
+            ('_Value1', num(0, 3)),
+            ('_Value2', real(0, 2)),
+            ('_Value3', pick('', 'foo', 'bar')),
+        ],
+    }
+
+ABILITY_NAMES = (
+    'Strength +{ability_val0}%',
+    'Skill Damage +{ability_val0}%',
+    'Flurry Strength {ability_val0}',
+)
+# Chain co-abilities are the last rows of AbilityData, 30 at scale 1
+def chain_coability_count(count):
+    return max(1, count * 3 // 20)
+
+ABILITY_DETAILS = (
+    'Increases strength by {{ability_val0}}% when HP is above {{ability_cond0}}%.',
+    'Increases {{element_owner}} damage by {{ability_val0}}%.',
+    'Grants a  barrier of {{ability_val0}}%  when the user has a {{weapon_owner}}.',
+)
+
+SCHEMA = OrderedDict([
+    ('EmblemData', {
+        'count': 40,
+        'columns': [
+            ('_Id', seq(10100)),
+            ('_Title', label('EMBLEM_NAME_')),
+            ('_Phonetic', label('EMBLEM_PHONETIC_')),
+            ('_Rarity', num(1, 4)),
+            ('_Gettext', label('EMBLEM_GETTEXT_', 'A reward from the Event{n} event.')),
+        ],
+    }),
+    ('SkillData', {
+        'count': 120,
+        'columns': [
+            ('_Id', seq(100010101)),
+            ('_Name', label('SKILL_NAME_')),
+            ('_SkillType', num(0, 2)),
+            *numbered('_SkillLv{}IconName', 1, 4, const('Icon_Skill_001')),
+            *[('_Description{}'.format(i), label('SKILL_DETAIL_{}_'.format(i), 'Deals {n}% damage to enemies in front.'))
+              for i in range(1, 5)],
+            *[('_' + prefix + suffix, num(1000, 9000))
+              for suffix in ('', 'Edit', 'Dragon')
+              for prefix in ['Sp'] + ['SpLv' + str(i) for i in range(2, 5)]],
+            ('_IsAffectedByTension', pick('0', '1')),
+            ('_ZoominTime', real(0, 2)),
+            ('_Zoom2Time', real(0, 2)),
+            ('_ZoomWaitTime', real(0, 2)),
+            ('_SpRecoveryRule', num(0, 2)),
+            ('_AutoRecoverySpForDmode', pick('0', '0', '100')),
+            ('_AutoRecoverySpForDmodeWeaponSkill', pick('0', '0', '50')),
+            ('_OverChargeSkillId', pick('0', '0', '100010101')),
+        ],
+    }),
+    ('CharaModeData', {
+        'count': 20,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_GunMode', num(0, 3)),
+            ('_ActionId', num(100, 999)),
+        ],
+    }),
+    ('AbilityShiftGroup', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(9001)),
+            ('_AmuletEffectMaxLevel', const('3')),
+            ('_Level1', seq(400000001, 3)),
+            ('_Level2', seq(400000002, 3)),
+            ('_Level3', seq(400000003, 3)),
+        ],
+    }),
+    ('AbilityData', {
+        'count': 200,
+        'columns': [
+            ('_Id', seq(400000001)),
+            ('_PartyPowerWeight', num(0, 100)),
+            ('_ShiftGroupId', lambda ctx: str(9001 + ctx.index // 3) if ctx.index < 30 else str(ctx.rng.randint(0, 5))),
+            ('_AbilityType1UpValue', pick('0', '5', '10', '15')),
+            ('_WeaponType', num(0, 9)),
+            ('_ElementalType', pick('0', '1', '2', '3', '4', '5', '99')),
+            ('_Name', label('ABILITY_NAME_', None)),
+            # Chain co-abilities (the tail of the table) are formatted without weapon_owner
+            ('_Details', lambda ctx: label('ABILITY_DETAIL_', ABILITY_DETAILS[ctx.index % (2 if ctx.index >= ctx.count - chain_coability_count(ctx.count) else 3)])(ctx)),
+            ('_ConditionValue', num(0, 100)),
+            ('_AbilityIconName', const('Icon_Ability_1010001')),
+            ('_ViewAbilityGroupId1', num(0, 50)),
+            *numbered('_AbilityLimitedGroupId{}', 1, 3, pick('0', '1', '2')),
+            ('_AbilityText', label('ABILITY_TEXT_', '')),
+        ],
+        'labels': {
+            'ABILITY_NAME_': ABILITY_NAMES,
+        },
+    }),
+    ('AbilityLimitedGroup', {
+        'count': 5,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_MaxLimitedValue', num(10, 40)),
+            ('_AbilityLimitedText', label('ABILITY_LIMITED_TEXT_', 'Up to {{ability_limit0}}% total')),
+        ],
+    }),
+    ('ExAbilityData', {
+        'count': 40,
+        'columns': [
+            ('_Id', seq(500000001)),
+            ('_Name', label('EX_ABILITY_NAME_', 'Co-ability Strength +{n}%')),
+            ('_Details', label('EX_ABILITY_DETAIL_', 'Raises strength by {{value1}}%.')),
+            ('_AbilityType1UpValue0', num(1, 20)),
+            ('_AbilityIconName', const('Icon_Ability_1020001')),
+            ('_Category', num(0, 10)),
+            ('_PartyPowerWeight', num(0, 100)),
+        ],
+    }),
+    ('CharaData', {
+        'count': 60,
+        'columns': [
+            ('_Id', seq(10010101)),
+            ('_BaseId', seq(100001)),
+            ('_IsPlayable', lambda ctx: '0' if ctx.index % 6 == 5 else '1'),
+            ('_Name', label('CHARA_NAME_')),
+            ('_SecondName', lambda ctx: label('CHARA_NAME_COMMENT_')(ctx) if ctx.index % 4 == 0 else ''),
+            ('_EmblemId', ref('EmblemData')),
+            ('_ReleaseStartDate', date()),
+            ('_WeaponType', num(1, 9)),
+            ('_Rarity', num(3, 5)),
+            ('_ElementalType', num(1, 5)),
+            ('_CharaType', num(1, 4)),
+            ('_VariationId', num(1, 3)),
+            *[(f'_Min{stat}{i}', num(100, 500)) for stat in ('Hp', 'Atk') for i in range(3, 6)],
+            ('_MaxHp', num(500, 900)),
+            ('_MaxAtk', num(300, 600)),
+            ('_AddMaxHp1', num(10, 50)),
+            ('_AddMaxAtk1', num(10, 50)),
+            *[(f'_Plus{stat}{i}', num(0, 20)) for stat in ('Hp', 'Atk') for i in range(0, 6)],
+            ('_McFullBonusHp5', num(0, 50)),
+            ('_McFullBonusAtk5', num(0, 50)),
+            ('_MinDef', num(8, 12)),
+            ('_DefCoef', real(0, 1)),
+            ('_Skill1', ref('SkillData')),
+            ('_Skill2', ref('SkillData')),
+            ('_HoldEditSkillCost', num(0, 100)),
+            ('_EditSkillId', lambda ctx: ctx.rng.choice([ctx.row['_Skill1'], '0', ctx.pick('SkillData')])),
+            ('_EditSkillLevelNum', num(1, 3)),
+            ('_EditSkillCost', num(0, 100)),
+            ('_EditSkillRelationId', num(0, 100)),
+            ('_EditReleaseEntityType1', pick('8')),
+            ('_EditReleaseEntityId1', ref('MaterialData')),
+            ('_EditReleaseEntityQuantity1', num(1, 10)),
+            *[(f'_Abilities{i}{j}', ref('AbilityData', 0.2)) for i in range(1, 4) for j in range(1, 5)],
+            *numbered('_ExAbilityData{}', 1, 5, ref('ExAbilityData')),
+            *numbered('_ExAbility2Data{}', 1, 5, ref_tail('AbilityData', chain_coability_count)),
+            ('_ManaCircleName', lambda ctx: 'MC_0' + str(101 + ctx.index % 4)),
+            ('_CvInfo', label('CV_INFO_')),
+            ('_CvInfoEn', label('CV_INFO_EN_')),
+            ('_ProfileText', label('CHARA_PROFILE_')),
+            ('_MaxFriendshipPoint', num(0, 100)),
+            ('_MaxLimitBreakCount', num(4, 5)),
+            ('_CharaLimitBreak', ref('CharaLimitBreak')),
+            ('_PieceMaterialElementId', ref('ManaPieceElement')),
+            ('_GrowMaterialId', pick('0', '201001001')),
+            ('_UniqueGrowMaterialId1', pick('0', '201019011', '201019012')),
+            ('_UniqueGrowMaterialId2', pick('0', '201019013')),
+            ('_DefaultAbility1Level', pick('0', '1')),
+            ('_DefaultAbility2Level', pick('0', '1')),
+            ('_DefaultAbility3Level', pick('0', '1')),
+            ('_DefaultBurstAttackLevel', pick('0', '1')),
+            *numbered('_ModeId{}', 1, 4, ref('CharaModeData', 0.5)),
+            ('_UniqueWeaponSkinId', pick('0', '0', '30129901')),
+        ],
+    }),
+    ('CharaLimitBreak', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1)),
+            *[(f'_UniqueGrowMaterial{m}Num{f}', num(0, 12)) for m in (1, 2) for f in range(1, 6)],
+            *[(f'_OrbData{o}Id{f}', pick('201019011', '201019013', '104001011')) for o in range(1, 6) for f in range(1, 6)],
+            *[(f'_OrbData{o}Num{f}', num(0, 12)) for o in range(1, 6) for f in range(1, 6)],
+        ],
+    }),
+    ('ManaPieceElement', {
+        'count': 5,
+        'columns': [
+            ('_Id', seq(101)),
+        ],
+    }),
+    ('MC', {
+        'count': 80,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_EntriesKey', lambda ctx: str(101 + ctx.index // 20)),
+            ('_Hierarchy', lambda ctx: str(1 + (ctx.index % 20) // 10)),
+            ('_No', lambda ctx: str(1 + ctx.index % 10)),
+            ('_ManaPieceType', pick('10101', '10102', '10103', '10201', '10301', '10401', '10501', '10801')),
+            ('_IsReleaseStory', pick('0', '1')),
+            ('_NecessaryManaPoint', num(0, 12000)),
+            ('_UniqueGrowMaterialCount1', num(0, 10)),
+            ('_UniqueGrowMaterialCount2', num(0, 10)),
+        ],
+    }),
+    ('ManaPieceMaterial', {
+        'count': 60,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_ElementId', lambda ctx: str(101 + ctx.index // 12)),
+            ('_ManaPieceType', lambda ctx: ('10101', '10102', '10103', '10201')[(ctx.index // 3) % 4]),
+            ('_Step', lambda ctx: str(1 + ctx.index % 3)),
+            ('_DewPoint', pick('0', '500', '2000')),
+            *[(f'_MaterialId{i}', ref('MaterialData')) for i in range(1, 4)],
+            *[(f'_MaterialQuantity{i}', num(0, 9)) for i in range(1, 4)],
+        ],
+    }),
+    ('DragonData', {
+        'count': 40,
+        'columns': [
+            ('_Id', lambda ctx: str(20010101 + ctx.index) if ctx.index < ctx.count - 5 else str(29900001 + ctx.index)),
+            ('_BaseId', seq(210001)),
+            ('_Name', label('DRAGON_NAME_')),
+            ('_SecondName', lambda ctx: label('DRAGON_NAME_COMMENT_')(ctx) if ctx.index % 5 == 0 else ''),
+            ('_EmblemId', ref('EmblemData')),
+            ('_CharaBaseId', pick('0', '100001')),
+            ('_ReleaseStartDate', date()),
+            ('_Rarity', num(3, 5)),
+            ('_ElementalType', num(1, 5)),
+            ('_VariationId', num(1, 2)),
+            ('_IsPlayable', lambda ctx: '0' if ctx.index % 7 == 6 else '1'),
+            ('_MinHp', num(10, 50)),
+            ('_MaxHp', num(100, 400)),
+            ('_AddMaxHp1', num(0, 50)),
+            ('_MinAtk', num(10, 50)),
+            ('_MaxAtk', num(100, 300)),
+            ('_AddMaxAtk1', num(0, 50)),
+            ('_Skill1', ref('SkillData')),
+            ('_Skill2', ref('SkillData', 0.7)),
+            *[(f'_Abilities{i}{j}', ref('AbilityData', 0.3)) for i in (1, 2) for j in range(1, 7)],
+            ('_DmodePassiveAbilityId', pick('0', '1001')),
+            ('_Profile', label('DRAGON_PROFILE_')),
+            ('_MaxLimitBreakCount', num(4, 5)),
+            ('_LimitBreakId', num(1, 3)),
+            ('_LimitBreakMaterialId', ref('MaterialData')),
+            ('_FavoriteType', num(1, 6)),
+            ('_CvInfo', label('DRAGON_CV_INFO_')),
+            ('_CvInfoEn', label('DRAGON_CV_INFO_EN_')),
+            ('_SellCoin', num(100, 5000)),
+            ('_SellDewPoint', num(100, 5000)),
+            ('_MoveSpeed', real(0, 3)),
+            ('_DashSpeedRatio', real(0, 3)),
+            ('_TurnSpeed', real(0, 3)),
+            ('_IsTurnToDamageDir', pick('0', '1')),
+            ('_MoveType', num(0, 2)),
+            ('_IsLongLange', pick('0', '1')),
+        ],
+    }),
+    ('MaterialData', item_table(104001011, 'MATERIAL_NAME_', (
+        ('_MaterialRarity', num(1, 5)),
+        ('_QuestEventId', const('0')),
+        ('_Category', num(1, 3)),
+        ('_SortId', num(1, 100)),
+        ('_Exp', num(0, 100)),
+    ))),
+    ('UseItem', {
+        'count': 15,
+        'columns': [
+            ('_Id', seq(100001)),
+            ('_Name', label('USE_ITEM_NAME_')),
+            ('_Description', label('USE_ITEM_DESCRIPTION_')),
+        ],
+    }),
+    ('FortPlantData', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(100101)),
+            ('_Name', label('FORT_PLANT_NAME_')),
+            ('_Description', label('FORT_PLANT_DETAIL_')),
+            ('_PlantSize', num(1, 4)),
+        ],
+    }),
+    ('FortPlantDetail', {
+        'count': 60,
+        'columns': [
+            ('_Id', seq(10010100)),
+            ('_AssetGroup', lambda ctx: str(100101 + ctx.index // 6)),
+            ('_Level', lambda ctx: str(ctx.index % 6)),
+            ('_ImageUiName', lambda ctx: 'Fort_{}_{}'.format(100101 + ctx.index // 6, (ctx.index % 6) // 3)),
+            ('_EffectId', lambda ctx: ('0', '1', '2', '4', '6', '0', '0', '0', '0', '0')[(ctx.index // 6) % 10]),
+            ('_EffArgs1', num(0, 10)),
+            ('_EffArgs2', num(0, 10)),
+            ('_EventEffectType', lambda ctx: '1' if (ctx.index // 6) % 10 == 5 else '0'),
+            ('_EventEffectArgs', num(0, 10)),
+            ('_MaterialMaxTime', lambda ctx: '3600' if (ctx.index // 6) % 10 == 6 else '0'),
+            ('_MaterialMax', num(1, 10)),
+            ('_Odds', lambda ctx: 'FortFruitOdds_' + str(ctx.index % 6)),
+            ('_CostMaxTime', lambda ctx: '3600' if (ctx.index // 6) % 10 == 7 else '0'),
+            ('_CostMax', num(1000, 100000)),
+            ('_Cost', num(0, 2000000)),
+            *[(f'_MaterialsId{i}', lambda ctx, i=i: ctx.pick('MaterialData') if (ctx.index // 6) % 10 != 8 or i == 1 else '0') for i in range(1, 6)],
+            *[(f'_MaterialsNum{i}', num(1, 80)) for i in range(1, 6)],
+            ('_NeedLevel', num(1, 30)),
+            ('_Time', num(0, 100000)),
+        ],
+    }),
+    ('DragonGiftData', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(10001)),
+            ('_Name', label('DRAGON_GIFT_NAME_')),
+            ('_Descripsion', label('DRAGON_GIFT_TEXT_')),
+            ('_SortId', num(1, 10)),
+            ('_Reliability', num(100, 1000)),
+            ('_FavoriteReliability', num(100, 1000)),
+            ('_FavoriteType', num(0, 6)),
+        ],
+    }),
+    ('StampData', {
+        'count': 30,
+        'columns': [
+            ('_Id', seq(10001)),
+            ('_Title', label('STAMP_NAME_')),
+            ('_InfoMsg', lambda ctx: label('STAMP_INFO_', 'A reward from the "Event {}" event.'.format(ctx.index % 3)
+                                         if ctx.index % 2 else 'A standard sticker.')(ctx)),
+            ('_VoiceId', seq(9001)),
+            ('_SortId', num(1, 100)),
+        ],
+    }),
+    ('AbilityCrest', {
+        'count': 50,
+        'columns': [
+            ('_Id', seq(40010001)),
+            ('_BaseId', seq(400001)),
+            ('_Name', label('AMULET_NAME_')),
+            ('_IsHideChangeImage', pick('0', '1')),
+            ('_Rarity', num(2, 5)),
+            ('_AbilityCrestType', num(1, 3)),
+            ('_CrestSlotType', num(1, 3)),
+            ('_UnitType', num(1, 2)),
+            ('_BaseHp', num(10, 50)),
+            ('_MaxHp', num(50, 100)),
+            ('_BaseAtk', num(10, 50)),
+            ('_MaxAtk', num(50, 100)),
+            ('_VariationId', num(1, 2)),
+            *[(f'_Abilities{i}{j}', ref('AbilityData', 0.3)) for i in (1, 2) for j in range(1, 4)],
+            ('_UnionAbilityGroupId', num(0, 10)),
+            *[(f'_Text{i}', label(f'AMULET_TEXT_{i}_')) for i in range(1, 6)],
+            ('_IsPlayable', pick('0', '1')),
+            *entities('_Duplicate', 1, ('4', '14', '8')),
+            ('_AbilityCrestBuildupGroupId', num(1, 5)),
+            ('_UniqueBuildupMaterialId', ref('MaterialData')),
+            ('_AbilityCrestLevelRarityGroupId', num(1, 5)),
+            ('_CvInfo', label('AMULET_CV_INFO_')),
+        ],
+    }),
+    ('AbilityCrestTrade', {
+        'count': 30,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_AbilityCrestId', seq(40010001, 1)),
+            ('_NeedDewPoint', num(100, 10000)),
+            ('_CommenceDate', date()),
+            ('_MemoryPickupEventId', pick('0', '0', '20801')),
+            ('_CompleteDate', pick('', '', '2021/01/01 00:00:00')),
+        ],
+    }),
+    ('WeaponSkin', {
+        'count': 40,
+        'columns': [
+            ('_Id', seq(30129901)),
+            ('_Name', label('WEAPON_SKIN_NAME_', 'Skin Weapon {n} (Skin)')),
+            ('_Text', label('WEAPON_SKIN_TEXT_')),
+            ('_BaseId', seq(300001)),
+            ('_VariationId', num(1, 3)),
+            ('_FormId', num(0, 2)),
+            ('_WeaponType', num(1, 9)),
+            ('_Rarity', num(3, 5)),
+            *entities('_Duplicate', 1, ('4', '14')),
+            ('_EntriesKey', seq(1)),
+        ],
+    }),
+    ('WeaponBody', {
+        'count': 30,
+        'columns': [
+            ('_Id', seq(30110101)),
+            ('_Name', label('WEAPON_NAME_')),
+            ('_WeaponSeriesId', num(1, 8)),
+            ('_WeaponSkinId', seq(30129901)),
+            ('_WeaponType', num(1, 9)),
+            ('_Rarity', num(3, 6)),
+            ('_ElementalType', num(0, 5)),
+            ('_CreateCoin', pick('0', '50000')),
+            ('_MaxLimitOverCount', num(0, 4)),
+            *[(k, num(10, 500)) for k in ('_BaseHp', '_MaxHp1', '_MaxHp2', '_MaxHp3',
+                                          '_BaseAtk', '_MaxAtk1', '_MaxAtk2', '_MaxAtk3')],
+            ('_LimitOverCountPartyPower1', num(0, 100)),
+            ('_LimitOverCountPartyPower2', num(0, 100)),
+            *[(f'_CrestSlotType{i}{k}Count', num(0, 2)) for i in (1, 2, 3) for k in ('Base', 'Max')],
+            *numbered('_ChangeSkillId{}', 1, 3, ref('SkillData', 0.5)),
+            *[(f'_Abilities{i}{j}', ref('AbilityData', 0.5)) for i in (1, 2) for j in range(1, 4)],
+            ('_IsPlayable', pick('0', '1')),
+            ('_Text', label('WEAPON_TEXT_')),
+            ('_CreateStartDate', date()),
+            ('_NeedFortCraftLevel', num(1, 9)),
+            ('_NeedCreateWeaponBodyId1', pick('0', '30110101')),
+            ('_NeedCreateWeaponBodyId2', const('0')),
+            ('_NeedAllUnlockWeaponBodyId1', const('0')),
+            *entities('_Create', 5, ('0', '8', '4'), quantity_key='EntityQuantity'),
+            *entities('_Duplicate', 1, ('4', '14')),
+            ('_WeaponPassiveAbilityGroupId', num(0, 100)),
+            ('_WeaponBodyBuildupGroupId', num(0, 100)),
+            ('_MaxWeaponPassiveCharaCount', num(0, 3)),
+            ('_WeaponPassiveEffHp', real(0, 1)),
+            ('_WeaponPassiveEffAtk', real(0, 1)),
+            *numbered('_RewardWeaponSkinId{}', 1, 5, ref('WeaponSkin', 0.7)),
+        ],
+    }),
+    ('TalismanData', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(50000001)),
+            ('_Name', label('TALISMAN_NAME_')),
+            ('_BaseHp', num(10, 50)),
+            ('_BaseAtk', num(10, 50)),
+            ('_TalismanCharaId', ref('CharaData')),
+            ('_SellCoin', num(10, 500)),
+        ],
+    }),
+    ('DmodePoint', {
+        'count': 2,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_Name', label('DMODE_POINT_NAME_')),
+            ('_Description', label('DMODE_POINT_DESCRIPTION_')),
+        ],
+    }),
+    ('DmodeAbilityCrest', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_EntriesKey', seq(1)),
+            ('_AbilityCrestId', ref('AbilityCrest')),
+            ('_StrengthAbilityGroupId', num(1, 5)),
+        ],
+    }),
+    ('DmodeWeapon', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1001)),
+            ('_WeaponSkinId', ref('WeaponSkin')),
+            ('_StrengthParamGroupId', num(1, 5)),
+            ('_StrengthAbilityGroupId', num(1, 5)),
+            ('_StrengthSkillGroupId', num(1, 5)),
+            ('_IsDefaultWeapon', pick('0', '1')),
+        ],
+    }),
+    ('DmodeDungeonItemData', {
+        'count': 30,
+        'columns': [
+            ('_Id', seq(10001)),
+            ('_DmodeDungeonItemType', lambda ctx: '3' if ctx.index < 10 else '2' if ctx.index < 20 else '1'),
+            ('_DungeonItemTargetId', lambda ctx: str(1 + ctx.index) if ctx.index < 10
+                else str(1001 + ctx.index - 10) if ctx.index < 20 else ctx.pick('DragonData')),
+            ('_Rarity', num(1, 5)),
+            ('_UseCount', num(1, 3)),
+            ('_SellDmodePoint1', num(0, 100)),
+            ('_SellDmodePoint2', num(0, 100)),
+        ],
+    }),
+    ('DmodeStory', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_SortId', num(1, 30)),
+            ('_Title', label('DMODE_STORY_TITLE_')),
+            ('_BodyText', label('DMODE_STORY_BODY_', 'Line one\\nline two {n}')),
+            ('_EntriesKey', seq(1)),
+        ],
+    }),
+    ('DmodeServitorPassive', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_ServitorPassiveType', num(0, 20)),
+            ('_PassiveName', label('DMODE_SERVITOR_PASSIVE_NAME_')),
+            ('_PassiveNum', num(1, 10)),
+            ('_SortId', num(1, 10)),
+            ('_IconImage', const('Icon_Servitor')),
+        ],
+    }),
+    ('DmodeServitorPassiveLevel', {
+        'count': 30,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_PassiveNum', num(1, 10)),
+            ('_PassiveDetail', label('DMODE_SERVITOR_PASSIVE_DETAIL_', 'Increases things by {{ability_val0}}%')),
+            ('_Level', num(1, 10)),
+            ('_UpValue', num(1, 30)),
+            *entities('_Release', 3, ('0', '42', '43', '8'), quantity_key='EntityQuantity'),
+        ],
+    }),
+    ('DmodeEnemyParam', {
+        'count': 20,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_DmodeEnemyParamGroupId', num(1, 5)),
+            ('_Level', num(1, 60)),
+            *[(k, num(0, 1000)) for k in ('_DropExp', '_DropDmodePoint1', '_DropDmodePoint2', '_DmodeScore',
+                                          '_Hp', '_Atk', '_Def', '_Overwhelm', '_BaseOD', '_BaseBreak')],
+            *numbered('_RegistAbnormalRate{:02d}', 1, 14, num(0, 100)),
+        ],
+    }),
+    ('DmodeExpeditionFloor', {
+        'count': 20,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_FloorNum', seq(10, 5)),
+            ('_NeedTime', pick('1800', '3600', '5400')),
+            ('_RewardDmodePoint1', pick('0', '100')),
+            ('_RewardDmodePoint2', pick('0', '100')),
+        ],
+    }),
+    ('DmodeCharaLevel', generic_table(1, 10)),
+    ('DmodeServitorDungeonLevel', generic_table(1, 10)),
+    ('DmodeStrengthAbility', generic_table(1, 10)),
+    ('DmodeStrengthParam', generic_table(1, 10)),
+    ('DmodeStrengthSkill', generic_table(1, 10)),
+    ('AbilityCrestBuildupGroup', generic_table(1, 10)),
+    ('AbilityCrestBuildupLevel', generic_table(1, 10)),
+    ('AbilityCrestRarity', generic_table(1, 5)),
+    ('DragonLimitBreak', generic_table(1, 5)),
+    ('WeaponBodyBuildupGroup', generic_table(1, 10)),
+    ('WeaponBodyBuildupLevel', generic_table(1, 10)),
+    ('WeaponBodyRarity', generic_table(1, 6)),
+    ('WeaponPassiveAbility', generic_table(1, 10)),
+    ('TreasureTrade', {
+        'count': 20,
+        'columns': [
+            ('_Id', seq(1001)),
+            ('_TradeGroupId', pick('1012', '1001')),
+            ('_Priority', num(1, 100)),
+            *entities('_Destination', 1, ('8', '42', '2')),
+            ('_Limit', num(0, 10)),
+            *entities('_Need', 5, ('0', '42', '8')),
+        ],
+    }),
+    ('ActionCondition', {
+        'count': 40,
+        'columns': [
+            ('_Id', seq(100)),
+            ('_Text', label('ACTION_CONDITION_', 'Buff {{0:P0}} up')),
+            ('_TextEx', lambda ctx: label('ACTION_CONDITION_EX_')(ctx) if ctx.index % 3 == 0 else ''),
+            ('_BuffIconId', ref('BuffIconData')),
+            ('_Overwrite', pick('0', '1')),
+            ('_OverwriteIdenticalOwner', pick('0', '1')),
+            ('_OverwriteGroupId', pick('0', '0', '5')),
+            ('_MaxDuplicatedCount', pick('0', '3')),
+        ],
+    }),
+    ('BuffIconData', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_IconName', pick('', 'Icon_Buff_Atk', 'Icon_Buff_Def')),
+        ],
+    }),
+    ('QuestMainGroup', {
+        'count': 5,
+        'columns': [
+            ('_Id', seq(1001)),
+            ('_ChapterNum', seq(1)),
+        ],
+    }),
+    ('AlbumStoryGroup', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1001)),
+            ('_AlbumStoryId', lambda ctx: '101' if ctx.index < 5 else '201'),
+            ('_SortId', num(1, 100)),
+            ('_ReleaseQuestStoryId', num(1000, 9000)),
+            ('_ViewStartDate', date()),
+            ('_ViewEndDate', date()),
+            *[col for i in range(1, 9) for col in (
+                (f'_ViewEntityType{i}', pick('0', '1', '7')),
+                (f'_ViewEntityId{i}', lambda ctx, i=i: ctx.pick(
+                    {'1': 'CharaData', '7': 'DragonData'}[ctx.row[f'_ViewEntityType{i}']])
+                    if ctx.row[f'_ViewEntityType{i}'] != '0' else '0'),
+            )],
+            *numbered('_ArtworkImageId{}', 1, 12, pick('0', '100', '200')),
+        ],
+    }),
+    ('EnemyList', {
+        'count': 20,
+        'columns': [
+            ('_Id', seq(100010101)),
+            ('_Name', label('ENEMY_NAME_')),
+            ('_TribeType', num(0, 7)),
+        ],
+    }),
+    ('EnemyData', {
+        'count': 30,
+        'columns': [
+            ('_Id', seq(200000001)),
+            ('_BookId', ref('EnemyList')),
+            ('_Category', num(0, 5)),
+            ('_EnemyGroupName', pick('ENM_A', 'BOS_B', 'RID_C')),
+            ('_BaseId', num(1, 100)),
+            ('_VariationId', num(1, 3)),
+            ('_WeaponId', const('0')),
+            ('_ElementalType', num(1, 5)),
+            *[(k, real(0, 2)) for k in ('_BreakDuration', '_MoveSpeed', '_TurnSpeed', '_SuperArmor',
+                                        '_BreakAtkRate', '_BreakDefRate', '_ObAtkRate', '_ObDefRate')],
+        ],
+    }),
+    ('EnemyParam', {
+        'count': 80,
+        'columns': [
+            ('_Id', seq(210010001)),
+            ('_DataId', ref('EnemyData')),
+            ('_DmodeEnemyParamGroupId', pick('0', '0', '1', '2')),
+            ('_ParamGroupName', pick('MAIN_01_0101_E_01', 'EXP_01_01_E', 'DEBUG_01')),
+            ('_RareStayTime', num(0, 10)),
+            *[(k, num(0, 100000)) for k in ('_HP', '_Atk', '_Def', '_Overwhelm', '_BaseOD', '_BaseBreak',
+                                            '_CounterRate', '_BarrierRate', '_GetupActionRate')],
+            *numbered('_RegistAbnormalRate{:02d}', 1, 14, num(0, 100)),
+            *[(f'_Parts{p}', const('0')) for p in ('A', 'B', 'C', 'D', 'Node')],
+            *numbered('_Ability{:02d}', 1, 4, pick('0', '100')),
+        ],
+    }),
+    ('BattleRoyalCharaSkin', {
+        'count': 8,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_BaseCharaId', seq(10010101)),
+            ('_SpecialSkillId', pick('0', '100010101')),
+            ('_UnlockMaterialId', ref('MaterialData')),
+            ('_AnimController', const('anim')),
+            ('_EntriesKey', seq(1)),
+            ('_UnlockMaterialQuantity', num(1, 100)),
+        ],
+    }),
+    ('BattleRoyalUnit', {
+        'count': 9,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_BaseCharaDataId', ref('CharaData')),
+            ('_SkillId', ref('SkillData')),
+            ('_Hp', num(100, 1000)),
+            ('_Atk', num(100, 1000)),
+            *[(f'_{k}{i}', num(1, 100)) for k in ('NeedsNumWeaponLv', 'AtkRatioWeaponLv', 'HpLv') for i in range(2, 10)],
+        ],
+    }),
+    ('BattleRoyalDragonSchedule', {
+        'count': 5,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_DragonId', ref('DragonData')),
+            ('_StartDate', date()),
+            ('_EndDate', date()),
+        ],
+    }),
+    ('BattleRoyalCharaSkinPickup', {
+        'count': 5,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_BattleRoyalCharaId', ref('CharaData')),
+            ('_PickupStartDate', date()),
+            ('_PickupEndDate', date()),
+        ],
+    }),
+    ('BattleRoyalEnemy', {
+        'count': 5,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_BaseEnemyParamId', ref('EnemyParam')),
+            ('_CanEnterBush', pick('0', '1')),
+        ],
+    }),
+    ('BattleRoyalEventCycle', {
+        'count': 5,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_StartDate', date()),
+            ('_EndDate', date()),
+        ],
+    }),
+    ('EventCyclePointReward', {
+        'count': 40,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_EventCycleId', ref('BattleRoyalEventCycle')),
+            *entities('_Reward', 1, ('4', '8', '18'), quantity_key='EntityQuantity'),
+            ('_EventItemQuantity', num(100, 10000)),
+        ],
+    }),
+    ('LoginBonusData', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_LoginBonusName', label('LOGIN_BONUS_NAME_')),
+            ('_StartTime', date()),
+            ('_EndTime', date()),
+            ('_EachDayEntityType', const('0')),
+            ('_EachDayEntityQuantity', const('0')),
+        ],
+    }),
+    ('LoginBonusReward', {
+        'count': 70,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_Gid', lambda ctx: str(1 + ctx.index // 7)),
+            ('_Day', lambda ctx: str(1 + ctx.index % 7)),
+            *entities('_', 1, ('2', '4', '8', '11', '23')),
+        ],
+    }),
+    ('QuestScoringEnemy', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_ScoringEnemyGroupId', num(1, 3)),
+            ('_EnemyListId', ref('EnemyList')),
+            ('_Point', num(1, 100)),
+            ('_EntriesKey', seq(1)),
+        ],
+    }),
+    ('CampaignData', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_CampaignName', label('CAMPAIGN_NAME_')),
+            ('_CampaignType', pick('9', '1')),
+            ('_StartDate', date()),
+            ('_EndDate', date()),
+            ('_CampaignText', label('CAMPAIGN_TEXT_')),
+        ],
+    }),
+    ('EventData', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(20801)),
+            ('_Name', label('EVENT_NAME_', 'Event {n}')),
+            ('_StartDate', date()),
+            ('_EndDate', date()),
+            ('_EventKindType', num(1, 12)),
+        ],
+    }),
+    ('MissionDailyData', {
+        'count': 40,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_Text', label('MISSION_DAILY_TEXT_')),
+            ('_SortId', num(1, 40)),
+            ('_CampaignId', ref('CampaignData', 0.3)),
+            ('_QuestGroupId', ref('EventData', 0.3)),
+            *entities('_', 1, ('2', '4', '10', '11', '18', '23')),
+        ],
+    }),
+    ('MissionPeriodData', {
+        'count': 40,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_Text', label('MISSION_PERIOD_TEXT_')),
+            ('_SortId', num(1, 40)),
+            ('_CampaignId', ref('CampaignData', 0.3)),
+            ('_QuestGroupId', ref('EventData', 0.3)),
+            *entities('_', 1, ('2', '3', '4', '7', '10', '12')),
+        ],
+    }),
+    ('MissionMemoryEventData', {
+        'count': 20,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_Text', label('MISSION_MEMORY_TEXT_')),
+            ('_SortId', num(1, 40)),
+            ('_EventId', ref('EventData')),
+            *entities('_', 1, ('4', '10', '11')),
+        ],
+    }),
+    ('MissionAlbumData', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_Text', label('MISSION_ALBUM_TEXT_')),
+            *entities('_', 1, ('2', '3', '7', '10', '11', '12')),
+        ],
+    }),
+    ('MissionMainStoryData', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_Text', label('MISSION_MAIN_STORY_TEXT_')),
+            *entities('_', 1, ('4', '14', '23')),
+        ],
+    }),
+    ('MissionNormalData', {
+        'count': 20,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_Text', label('MISSION_NORMAL_TEXT_')),
+            *entities('_', 1, ('2', '8', '10', '23')),
+        ],
+    }),
+    ('HonorData', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_HonorName', label('HONOR_NAME_', 'Medal {n} Medal (Gold Class)')),
+            ('_Description', label('HONOR_DESCRIPTION_')),
+            ('_SortId', num(1, 100)),
+            ('_StartDate', date()),
+            ('_EndDate', pick('', '2022/01/01 00:00:00')),
+        ],
+    }),
+    ('RankingGroupData', {
+        'count': 5,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_RankingTierGroupId', seq(1)),
+            ('_RankingStartDate', date()),
+            ('_RankingEndDate', date()),
+            ('_RankingViewEndDate', date()),
+        ],
+    }),
+    ('RankingTierReward', {
+        'count': 30,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_GroupId', lambda ctx: str(1 + ctx.index // 6)),
+            ('_QuestId', lambda ctx: labelled(lambda c: str(227010101 + (c.index // 3) % 2), 'QUEST_NAME_', 'Time Attack: Quest {id}')(ctx)),
+            ('_RankingDifficultyText', label('RANKING_DIFFICULTY_', 'Tier{n} Difficulty')),
+            ('_ClearTimeLower', real(60, 300)),
+            ('_ClearTimeUpper', real(300, 600)),
+            *entities('_RankingReward', 1, ('10', '8'), quantity_key='EntityQuantity'),
+        ],
+    }),
+    ('QuestData', {
+        'count': 100,
+        'columns': [
+            ('_Id', seq(100010101)),
+            ('_Gid', pick('10001', '20801', '20802')),
+            ('_GroupType', pick('1', '2', '3')),
+            ('_AreaName01', pick('MAIN_01', 'AGITO_01', 'RAID_01', 'COMBAT_01', 'CLB_DEF_01', 'XYZ')),
+            ('_QuestViewName', label('QUEST_NAME_', 'Quest Group {n}: Quest {id}')),
+            ('_SectionName', label('QUEST_SECTION_')),
+            ('_Elemental', num(0, 5)),
+            ('_Elemental2', num(0, 5)),
+            ('_LimitedElementalType', num(0, 5)),
+            ('_LimitedElementalType2', num(0, 5)),
+            ('_LimitedWeaponTypePatternId', num(0, 5)),
+            ('_QuestOverwriteId', pick('0', '1')),
+            ('_QuestOrderPartyGroupId', pick('0', '5')),
+            ('_Difficulty', num(1000, 50000)),
+            ('_DifficultyLimit', pick('0', '30000')),
+            ('_SkipTicketCount', pick('1', '-1', '0')),
+            ('_PayStaminaSingle', pick('0', '12')),
+            ('_CampaignStaminaSingle', pick('0', '6')),
+            ('_PayStaminaMulti', pick('0', '1')),
+            ('_CampaignStaminaMulti', pick('0', '1')),
+            *entities('_Pay', 1, ('0', '8', '24')),
+            ('_ClearTermsType', num(1, 3)),
+            ('_FailedTermsType', num(0, 6)),
+            ('_FailedTermsTimeElapsed', pick('0', '300')),
+            ('_ContinueLimit', num(0, 3)),
+            ('_RebornLimit', num(0, 3)),
+            ('_ThumbnailImage', const('thumb')),
+            ('_AutoPlayType', num(0, 2)),
+            ('_VariationType', num(1, 4)),
+            ('_QuestPlayModeType', num(1, 4)),
+        ],
+    }),
+    ('QuestRewardData', {
+        'count': 80,
+        'columns': [
+            ('_Id', seq(100010101)),
+            *entities('_FirstClearSet', 5, ('0', '8', '23', '3', '10')),
+            *[col for i in range(1, 4) for col in (
+                (f'_MissionCompleteType{i}', pick('1', '15', '18', '32')),
+                (f'_MissionCompleteValues{i}', num(0, 3)),
+                (f'_MissionsClearSetEntityType{i}', pick('0', '4', '14', '23')),
+                (f'_MissionsClearSetEntityQuantity{i}', num(1, 50)),
+            )],
+            ('_MissionCompleteEntityType', pick('4', '23')),
+            ('_MissionCompleteEntityQuantity', num(1, 50)),
+            ('_DropLimitBreakMaterialId', pick('0', '104001011')),
+            ('_DropLimitBreakMaterialQuantity', num(1, 5)),
+            ('_LimitBreakMaterialDailyDrop', num(1, 5)),
+            ('_QuestScoringEnemyGroupId', pick('0', '0', '1')),
+        ],
+    }),
+    ('QuestEvent', {
+        'count': 3,
+        'columns': [
+            ('_Id', pick('10001', '20801')),
+            ('_QuestBonusType', pick('1', '2')),
+            ('_QuestBonusCount', num(1, 5)),
+        ],
+    }),
+    ('QuestMainMenu', {
+        'count': 20,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_EntryQuestType1', lambda ctx: ('1', '2', '3', '2')[ctx.index % 4]),
+            ('_EntryQuestId1', lambda ctx: labelled(
+                const(str(100010101 + ctx.index)),
+                {'1': 'QUEST_TITLE_', '2': 'STORY_QUEST_TITLE_', '3': 'X_'}[ctx.row['_EntryQuestType1']],
+                'Ch. 1 / Part-{n}' if ctx.index % 8 != 3 else 'Interlude {n}')(ctx)),
+            ('_GroupId', labelled(pick('10001', '10002'), 'QUEST_GROUP_NAME_', 'Chapter Name {id}')),
+            ('_LocationId', labelled(pick('1', '2'), 'QUEST_LANDMARK_NAME_', 'A{id}. Landmark {id}')),
+            ('_ReleaseQuestType1', pick('1', '2')),
+            ('_ReleaseQuestId1', lambda ctx: '0' if ctx.index == 0 else str(100010101 + ctx.index - 1)),
+            ('_ReleaseQuestId2', const('0')),
+            ('_ReleaseQuestId3', const('0')),
+        ],
+    }),
+    ('QuestWallMonthlyReward', {
+        'count': 20,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_TotalWallLevel', seq(1)),
+            ('_RewardEntityType', lambda ctx: ('18', '4', '14', '8')[ctx.index % 4]),
+            ('_RewardEntityId', lambda ctx: '202004004' if ctx.row['_RewardEntityType'] == '8' else '0'),
+            ('_RewardEntityQuantity', num(1, 10000)),
+        ],
+    }),
+    ('QuestWeaponTypePattern', {
+        'count': 5,
+        'columns': [
+            ('_Id', seq(1)),
+            *numbered('_IsPatternWeaponType{}', 1, 9, pick('0', '1')),
+            ('_EntriesKey', seq(1)),
+        ],
+    }),
+    ('UnionAbility', {
+        'count': 5,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_Name', label('UNION_ABILITY_NAME_')),
+            ('_AbilityId1', ref('AbilityData')),
+        ],
+    }),
+    ('BuildEventReward', {
+        'count': 30,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_EntriesKey', ref('EventData')),
+            ('_EventItemQuantity', num(100, 10000)),
+            *entities('_Reward', 1, ('4', '8', '17'), quantity_key='EntityQuantity'),
+        ],
+    }),
+    ('RaidEventReward', {
+        'count': 30,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_EntriesKey', ref('EventData')),
+            ('_RaidEventItemId', ref('RaidEventItem')),
+            ('_RaidEventItemQuantity', num(1, 100)),
+            *entities('_Reward', 1, ('4', '8', '20'), quantity_key='EntityQuantity'),
+        ],
+    }),
+    ('CombatEventLocation', {
+        'count': 10,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_EventId', ref('EventData')),
+            ('_LocationRewardId', seq(1)),
+            ('_LocationName', label('COMBAT_LOCATION_NAME_')),
+        ],
+    }),
+    ('CombatEventLocationReward', {
+        'count': 30,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_LocationRewardId', lambda ctx: str(1 + ctx.index % 10)),
+            ('_EventId', lambda ctx: ctx.rows['CombatEventLocation'][ctx.index % 10]['_EventId']),
+            *entities('_', 1, ('8', '34')),
+        ],
+    }),
+    ('AstralItem', item_table(10001, 'ASTRAL_ITEM_NAME_')),
+    ('BuildEventItem', item_table(10101, 'BUILD_EVENT_ITEM_NAME_', (('_EventId', ref('EventData')),))),
+    ('BattleRoyalEventItem', item_table(10201, 'EV_BATTLE_ROYAL_ITEM_NAME_', (('_EventId', ref('EventData')),))),
+    ('Clb01EventItem', item_table(10301, 'CLB01_EVENT_ITEM_NAME_', (('_EventId', ref('EventData')),))),
+    ('CollectEventItem', item_table(10401, 'COLLECT_EVENT_ITEM_NAME_', (('_EventId', ref('EventData')),))),
+    ('CombatEventItem', item_table(10501, 'COMBAT_EVENT_ITEM_NAME_', (('_EventId', ref('EventData')),))),
+    ('EarnEventItem', item_table(10601, 'EARN_EVENT_ITEM_NAME_', (('_EventId', ref('EventData')),))),
+    ('ExHunterEventItem', item_table(10701, 'EX_HUNTER_EVENT_ITEM_NAME_', (('_EventId', ref('EventData')),))),
+    ('ExRushEventItem', item_table(10801, 'EX_RUSH_EVENT_ITEM_NAME_', (('_EventId', ref('EventData')),))),
+    ('GatherItem', item_table(10901, 'GATHER_ITEM_NAME_')),
+    ('RaidEventItem', {
+        'count': 9,
+        'columns': [
+            ('_Id', seq(11001)),
+            ('_Name', label('RAID_EVENT_ITEM_NAME_', None)),
+            ('_Detail', label('RAID_EVENT_ITEM_DETAIL_')),
+            ('_Description', label('RAID_EVENT_ITEM_DESCRIPTION_')),
+            ('_RaidEventId', ref('EventData')),
+            *numbered('_MoveQuest{}', 1, 5, const('0')),
+            ('_PouchRarity', num(1, 5)),
+        ],
+        'labels': {
+            'RAID_EVENT_ITEM_NAME_': ('Bronze Emblem', 'Silver Emblem', 'Gold Emblem'),
+        },
+    }),
+    ('SimpleEventItem', item_table(11101, 'SIMPLE_EVENT_ITEM_NAME_', (('_EventId', ref('EventData')),))),
+    ('CharaUniqueCombo', kv_table(1, 10)),
+    ('CommonActionHitAttribute', kv_table(1, 20)),
+    ('EnemyAbility', kv_table(1, 20)),
+    ('EnemyActionHitAttribute', kv_table(1, 20)),
+    ('EventPassive', kv_table(1, 10)),
+    ('PlayerAction', kv_table(100001, 40)),
+    ('PlayerActionHitAttribute', kv_table(1, 60)),
+    ('WeaponData', {
+        'count': 1,
+        'columns': [
+            ('_Id', seq(1)),
+            ('_Name', label('WEAPON_DATA_NAME_')),
+        ],
+    }),
+])
+
+# Tables whose ids other tables reference by range rather than by ref(), and
+# therefore must not be scaled independently of the referencing table.
+FIXED_SIZE_TABLES = {
+    'AbilityShiftGroup', 'CharaModeData', 'ManaPieceElement', 'ManaPieceMaterial', 'MC',
+    'QuestMainGroup', 'AlbumStoryGroup', 'DmodeAbilityCrest', 'DmodeWeapon', 'DmodeDungeonItemData',
+    'AbilityCrestTrade', 'QuestEvent', 'RaidEventItem',
+    'RankingTierReward', 'RankingGroupData', 'CombatEventLocation', 'CombatEventLocationReward',
+    'DmodePoint', 'BattleRoyalCharaSkin', 'QuestWallMonthlyReward', 'WeaponData',
+}
+
+LANGUAGES = {
+    'TextLabel': '{}',
+    'TextLabelJP': '{}（JP）',
+    'TextLabelSC': '{}（SC）',
+    'TextLabelTC': '{}（TC）',
+}
+
+
+def table_count(table_name, scale):
+    count = SCHEMA[table_name]['count']
+    if table_name in FIXED_SIZE_TABLES:
+        return count
+    return max(1, int(count * scale))
+
+
+def generate(output_dir='./synthetic-data', scale=1.0, seed=0):
+    rng = random.Random(seed)
+    labels = OrderedDict()
+    ids = {}
+    rows = {}
+    ctx = Context(rng, ids, labels)
+    ctx.rows = rows
+
+    # Ids first, so that references can point at tables generated later.
+    for table_name, spec in SCHEMA.items():
+        id_spec = dict(spec['columns'])['_Id']
+        ids[table_name] = []
+        ctx.count = table_count(table_name, scale)
+        for i in range(ctx.count):
+            ctx.index = i
+            ctx.row = {}
+            ids[table_name].append(id_spec(ctx))
+
+    for table_name, spec in SCHEMA.items():
+        label_texts = spec.get('labels', {})
+        table_rows = []
+        ctx.count = table_count(table_name, scale)
+        for i in range(ctx.count):
+            ctx.index = i
+            ctx.row = OrderedDict()
+            for column, value_spec in spec['columns']:
+                if column == '_Id':
+                    ctx.row[column] = ids[table_name][i]
+                    continue
+                ctx.row[column] = value_spec(ctx)
+            for prefix, texts in label_texts.items():
+                for column, value in ctx.row.items():
+                    if value.startswith(prefix):
+                        labels[value] = texts[i % len(texts)]
+            table_rows.append(ctx.row)
+        rows[table_name] = table_rows
+
+    os.makedirs(output_dir, exist_ok=True)
+    for table_name, table_rows in rows.items():
+        columns = [c for c, _ in SCHEMA[table_name]['columns']]
+        with open(os.path.join(output_dir, table_name + EXT), 'w', newline='', encoding='utf-8') as out_file:
+            writer = csv.writer(out_file)
+            writer.writerow(columns)
+            # Monos start with an all-zero placeholder row
+            writer.writerow(['0'] * len(columns))
+            for row in table_rows:
+                writer.writerow([row[c] for c in columns])
+
+    for table_name, text_format in LANGUAGES.items():
+        with open(os.path.join(output_dir, table_name + EXT), 'w', newline='', encoding='utf-8') as out_file:
+            writer = csv.writer(out_file, dialect='excel-tab')
+            writer.writerow(['_Id', '_Text'])
+            for key, text in labels.items():
+                writer.writerow([key, text_format.format(text) if text else text])
+
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a synthetic mono dump for Process_DL_Data.py.')
+    parser.add_argument('-o', type=str, help='directory of output text files  (default: ./synthetic-data)', default='./synthetic-data')
+    parser.add_argument('--scale', type=float, help='row count multiplier (default: 1)', default=1.0)
+    parser.add_argument('--seed', type=int, help='random seed (default: 0)', default=0)
+
+    args = parser.parse_args()
+    generate(output_dir=args.o, scale=args.scale, seed=args.seed)
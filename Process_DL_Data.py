@@ -3,16 +3,29 @@
 
 import argparse
 import csv
+import functools
 import glob
+import hashlib
 import json
+import mmap
+import multiprocessing
+import multiprocessing.connection
 import os
+import pickle
 import re
 import sqlite3
 import string
+import struct
+import tempfile
+import time
 import traceback
+import tracemalloc
 
-from collections import OrderedDict, defaultdict
+from array import array
+from collections import Counter, OrderedDict, defaultdict
+from collections.abc import Mapping
 from datetime import datetime, timedelta
+from queue import Empty
 from shutil import copyfile, rmtree
 
 import pdb
@@ -30,6 +43,8 @@ TEXT_LABEL = 'TextLabel'
 TEXT_LABEL_JP = 'TextLabelJP'
 TEXT_LABEL_TC = 'TextLabelTC'
 TEXT_LABEL_SC = 'TextLabelSC'
+# Served from TextLabels label stores, so never loaded into the database
+TEXT_LABEL_TABLES = (TEXT_LABEL, TEXT_LABEL_JP, TEXT_LABEL_SC, TEXT_LABEL_TC)
 TEXT_LABEL_DICT = {}
 
 CHAIN_COAB_SET = set()
@@ -254,10 +269,49 @@ ENTITY_TYPE_DICT = {
     '42': (lambda id: '{{' + get_label_by_field(id, 'DmodePoint') + '-}}',
            lambda id: get_label_by_field(id, 'DmodePoint'),
            lambda id: 'KaleidoscapeItem'),
-    '43': (lambda id: '{{Icon|' + '|'.join(get_dmode_item(id).items()) + '|size=24px|text=1}}',
+    '43': (lambda id: '{{Icon|' + '|'.join(get_dmode_item(id).values()) + '|size=24px|text=1}}',
            lambda id: get_dmode_item(id)['label'],
            lambda id: get_dmode_item(id)['type']),
 }
+# Entity type -> table listing the ids of its entities, for EntityCatalog.
+# Types that are a single resource regardless of id are listed as None.
+ENTITY_TABLES = {
+    '1': 'CharaData',
+    '2': 'UseItem',
+    '3': 'WeaponData',
+    '4': None,
+    '7': 'DragonData',
+    '8': 'MaterialData',
+    '9': 'FortPlantData',
+    '10': 'EmblemData',
+    '11': 'StampData',
+    '12': 'AbilityCrest',
+    '14': None,
+    '15': 'DragonGiftData',
+    '16': None,
+    '17': 'SummonTicket',
+    '18': None,
+    '20': 'RaidEventItem',
+    '22': 'BuildEventItem',
+    '23': None,
+    '24': 'CollectEventItem',
+    '25': 'Clb01EventItem',
+    '26': 'AstralItem',
+    '28': None,
+    '29': 'ExRushEventItem',
+    '30': 'SimpleEventItem',
+    '31': 'LotteryTicket',
+    '32': 'ExHunterEventItem',
+    '33': 'GatherItem',
+    '34': 'CombatEventItem',
+    '37': 'WeaponSkin',
+    '38': 'WeaponBody',
+    '39': 'AbilityCrest',
+    '40': 'EarnEventItem',
+    '41': 'TalismanData',
+    '42': 'DmodePoint',
+    '43': 'DmodeDungeonItemData',
+}
 MISSION_ENTITY_OVERRIDES_DICT = {
     '3' : lambda x: ["Override={}".format(get_entity_item('3', x, format=0))],
     '7' : lambda x: ["Override={}".format(get_entity_item('7', x, format=0))],
@@ -278,42 +332,397 @@ EVENT_TYPES = {
     '12': 'Invasion',
 }
 
+# Secondary indexes created on load, for columns the processors look rows up or join by.
+# ROW_INDEX is indexed on every table.
+TABLE_INDEXES = {
+    'AbilityCrestTrade': ('_AbilityCrestId',),
+    'BattleRoyalCharaSkin': ('_BaseCharaId',),
+    'CampaignData': ('_CampaignType',),
+    'DmodeDungeonItemData': ('_DmodeDungeonItemType', '_DungeonItemTargetId'),
+    'EnemyData': ('_BookId',),
+    'EnemyParam': ('_DataId', '_DmodeEnemyParamGroupId'),
+    'EventCyclePointReward': ('_EventCycleId',),
+    'HonorData': ('_EndDate',),
+    'LoginBonusReward': ('_Gid',),
+    'MissionDailyData': ('_CampaignId', '_QuestGroupId'),
+    'MissionMemoryEventData': ('_EventId',),
+    'MissionPeriodData': ('_CampaignId', '_QuestGroupId'),
+    'QuestMainMenu': ('_ReleaseQuestId1', '_ReleaseQuestId2', '_ReleaseQuestId3'),
+    'TreasureTrade': ('_TradeGroupId',),
+    'WeaponBody': ('_WeaponSkinId',),
+}
+
+# Rows per batch sent from an ingest worker to the database writer
+INGEST_BATCH_SIZE = 5000
+# How often load_parallel checks on its workers while waiting for their rows
+INGEST_POLL_SECONDS = 1
+# Prepared statements kept per connection; queries bind their values, so their text repeats
+CACHED_STATEMENTS = 1024
+# Keys per IN (...) list in db_query_in, well under SQLite's bound variable limit
+IN_BATCH_SIZE = 500
+# Query text -> [calls, seconds], reported with --query_stats
+QUERY_STATS = defaultdict(lambda: [0, 0.0])
+# Tables grouped by db_group_by, kept for the rest of the run
+PREFETCH_CACHE = {}
+# Label text -> LabelTemplate compiled from it
+LABEL_TEMPLATES = {}
+# Name of the processor being run, that label lookups are attributed to when profiling
+CURRENT_PROCESSOR = None
+# Keys listed per processor and helper in a label profile
+LABEL_PROFILE_TOP_N = 20
+# Results kept per lookup helper decorated with resolver_cache
+RESOLVER_CACHE_SIZE = 8192
+RESOLVER_CACHES = {}
+# Tables read by the processor being run, while recording them for an incremental run
+TABLES_READ = None
+# Kept in the output directory by incremental runs: what each processor read last time
+INCREMENTAL_MANIFEST = '.manifest.json'
+# Bump whenever the manifest layout changes, so older manifests trigger a full run
+MANIFEST_VERSION = 1
+# Processes a row-independent DataParser splits its table across, see SHARDABLE_PROCESSING
+SHARD_WORKERS = 0
+# --workers and --shard_workers rely on forked processes inheriting the loaded state, so need fork to be there
+FORK_AVAILABLE = 'fork' in multiprocessing.get_all_start_methods()
+# Tables smaller than this are not worth forking for
+SHARD_MIN_ROWS = 2000
+# Whether DataParsers write each entity as it is appended instead of holding the table, see DataParser.stream
+STREAM_EMIT = False
+# Rows rendered at a time by render_rows, and kept in memory by a SpilledRows before the rest go to disk
+CHUNK_ROWS = 5000
+# Rows read from the database, entities emitted and bytes written so far, reported per processor
+RUN_COUNTERS = Counter()
+# Processor name -> what it took to run, see run_processor
+PROCESSOR_REPORT = {}
+# Processors listed in the run summary printed at the end of a run
+RUN_REPORT_TOP_N = 20
+# Where emitted entities are recorded while building a changelog
+ENTITY_SNAPSHOT = None
+# Seconds a forked processor waits for another to finish writing its entities
+SNAPSHOT_TIMEOUT = 60
+TABLE_NAME_REGEX = re.compile(r'\b(?:FROM|JOIN)\s+(\w+)', re.IGNORECASE)
+
 MATERIAL_NAME_LABEL = 'MATERIAL_NAME_'
 PERCENTAGE_REGEX = re.compile(r' (\d+)%')
 
+class KeyedRows:
+    """The (display name, row) pairs a DataParser emits, in order, with lookups by row field.
+
+    Appended to like a list. Tables merged into the rows of an earlier one find
+    their targets through lookup/lookup_all, which index the rows by a field
+    (e.g. 'Id' or '_Gid') the first time it is asked for, and keep that index
+    up to date as more rows are appended.
+    """
+    def __init__(self):
+        self.entries = []
+        self.indexes = {}
+
+    def append(self, entry):
+        self.entries.append(entry)
+        row = entry[1]
+        for field, index in self.indexes.items():
+            if field in row:
+                index[row[field]].append(row)
+
+    def index(self, field):
+        try:
+            return self.indexes[field]
+        except KeyError:
+            index = self.indexes[field] = defaultdict(list)
+            for _, row in self.entries:
+                if field in row:
+                    index[row[field]].append(row)
+            return index
+
+    def lookup(self, value, field='Id'):
+        """The first row whose field is value, or None."""
+        rows = self.index(field).get(value)
+        return rows[0] if rows else None
+
+    def lookup_all(self, value, field='Id'):
+        """Every row whose field is value, in emission order."""
+        return self.index(field).get(value, ())
+
+    def __getitem__(self, idx):
+        return self.entries[idx]
+
+    def __setitem__(self, idx, entry):
+        self.entries[idx] = entry
+        self.indexes.clear()
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+class StreamedRows:
+    """Stands in for the KeyedRows of a streamed DataParser: each entry is
+    handed to write as soon as it is appended, and none are kept.
+    """
+    def __init__(self, write):
+        self.write = write
+        self.length = 0
+
+    def append(self, entry):
+        self.write(entry)
+        self.length += 1
+
+    def __len__(self):
+        return self.length
+
+class SpilledRows:
+    """KeyedRows for streamed DataParsers whose functions go back to earlier rows
+    (see BUFFERED_PROCESSING), holding at most around CHUNK_ROWS of them in memory.
+
+    The rest are pickled to a temporary database by position. Rows handed out by
+    lookup/lookup_all stay in memory until the next call, so changes made to them
+    are written out with them. The indexes hold positions rather than rows.
+    """
+    def __init__(self):
+        self.con = sqlite3.connect('')
+        self.con.execute('CREATE TABLE entries (position INTEGER PRIMARY KEY, entry BLOB)')
+        self.loaded = {}
+        self.indexes = {}
+        self.length = 0
+
+    def spill(self):
+        self.con.executemany('INSERT OR REPLACE INTO entries VALUES (?, ?)', [
+            (position, pickle.dumps(entry, pickle.HIGHEST_PROTOCOL)) for position, entry in self.loaded.items()])
+        self.loaded.clear()
+
+    def make_room(self):
+        # Only done before anything is handed out, never while a caller may still change a loaded row
+        if len(self.loaded) >= CHUNK_ROWS:
+            self.spill()
+
+    def entry(self, position):
+        try:
+            return self.loaded[position]
+        except KeyError:
+            entry, = self.con.execute('SELECT entry FROM entries WHERE position = ?', (position,)).fetchone()
+            entry = self.loaded[position] = pickle.loads(entry)
+            return entry
+
+    def append(self, entry):
+        self.make_room()
+        self.loaded[self.length] = entry
+        row = entry[1]
+        for field, index in self.indexes.items():
+            if field in row:
+                index[row[field]].append(self.length)
+        self.length += 1
+
+    def index(self, field):
+        try:
+            return self.indexes[field]
+        except KeyError:
+            index = self.indexes[field] = defaultdict(list)
+            for position, (_, row) in enumerate(self):
+                if field in row:
+                    index[row[field]].append(position)
+            return index
+
+    def lookup(self, value, field='Id'):
+        """The first row whose field is value, or None."""
+        self.make_room()
+        positions = self.index(field).get(value)
+        return self.entry(positions[0])[1] if positions else None
+
+    def lookup_all(self, value, field='Id'):
+        """Every row whose field is value, in emission order."""
+        self.make_room()
+        return [self.entry(position)[1] for position in self.index(field).get(value, ())]
+
+    def close(self):
+        self.con.close()
+        self.loaded.clear()
+
+    def __iter__(self):
+        self.spill()
+        for entry, in self.con.execute('SELECT entry FROM entries ORDER BY position'):
+            yield pickle.loads(entry)
+
+    def __len__(self):
+        return self.length
+
 class DataParser:
     def __init__(self, _data_name, _template, _formatter, _process_info):
         self.data_name = _data_name
         self.template = _template
         self.formatter = _formatter
         self.process_info = _process_info
-        self.row_data = []
+        self.row_data = KeyedRows()
         self.extra_data = {}
+        # Rendered text of each chunk, when the table was rendered by render_rows
+        self.fragments = None
+        # Where rendered text goes straight to, when streaming
+        self.out_file = None
 
-    def process_csv(self, file_name, func):
-        with open(in_dir+file_name+EXT, 'r', newline='', encoding='utf-8') as in_file:
-            reader = csv.DictReader(in_file)
-            for row in reader:
-                if row[ROW_INDEX] == '0':
-                    continue
-                try:
-                    func(row, self.row_data)
-                except TypeError:
-                    func(row, self.row_data, self.extra_data)
-                # except Exception as e:
-                #     print('Error processing {}: {}'.format(file_name, str(e)))
+    def process_table(self, table_name, func):
+        for row in db_iter_table(table_name):
+            try:
+                func(row, self.row_data)
+            except TypeError:
+                func(row, self.row_data, self.extra_data)
+            # except Exception as e:
+            #     print('Error processing {}: {}'.format(table_name, str(e)))
 
     def process(self):
-        try: # process_info is an iteratable of (file_name, process_function)
-            for file_name, func in self.process_info:
-                self.process_csv(file_name, func)
+        if self.shardable() and self.process_sharded():
+            return
+        if self.bulk_renderable():
+            self.keep_rendered(render_rows(self.data_name, self.template, self.formatter, self.process_info))
+            return
+        try: # process_info is an iteratable of (table_name, process_function)
+            for table_name, func in self.process_info:
+                self.process_table(table_name, func)
         except TypeError: # process_info is the process_function
-            self.process_csv(self.data_name, self.process_info)
+            self.process_table(self.data_name, self.process_info)
+
+    def shardable(self):
+        # Entity snapshots and table tracking are per process, so they need every row in this one
+        return (SHARD_WORKERS > 1 and callable(self.process_info) and self.process_info in SHARDABLE_PROCESSING
+                and ENTITY_SNAPSHOT is None and TABLES_READ is None)
+
+    def bulk_renderable(self):
+        # Entity snapshots are taken from the processed rows, which bulk rendering never builds
+        return (callable(self.process_info) and (self.process_info, self.formatter) in COLUMNAR_PROCESSING
+                and ENTITY_SNAPSHOT is None)
+
+    def process_sharded(self):
+        """Renders the table in SHARD_WORKERS contiguous chunks of rows, each in a forked process.
+
+        The chunks' text is kept in order for emit, so the output is the same as
+        rendering every row here. Returns False, leaving the table to process, when
+        it is too small to be worth splitting up.
+        """
+        cursor = db.connection.cursor()
+        cursor.row_factory = None
+        rowids = [rowid for rowid, in db_execute(
+            cursor, f"SELECT rowid FROM {self.data_name} WHERE {ROW_INDEX} != '0' ORDER BY rowid")]
+        if len(rowids) < SHARD_MIN_ROWS:
+            return False
+        size = -(-len(rowids) // SHARD_WORKERS)
+        shards = [(self.data_name, self.template, self.formatter, self.process_info,
+                   rowids[start], rowids[min(start + size, len(rowids)) - 1])
+                  for start in range(0, len(rowids), size)]
+        with multiprocessing.get_context('fork').Pool(SHARD_WORKERS, initializer=reconnect_db) as pool:
+            self.keep_rendered(pool.imap(render_shard, shards))
+        return True
+
+    def keep_rendered(self, results):
+        # results are (text, rows read, entities rendered) from render_rows, in output order
+        self.fragments = []
+        for text, rows, entities in results:
+            if self.out_file is None:
+                self.fragments.append(text)
+            else:
+                self.out_file.write(text)
+            RUN_COUNTERS['rows'] += rows
+            RUN_COUNTERS['entities'] += entities
+
+    def buffered(self):
+        try:
+            return any(func in BUFFERED_PROCESSING for _, func in self.process_info)
+        except TypeError:
+            return False
+
+    def write_entry(self, out_file, entry):
+        display_name, row = entry
+        if ENTITY_SNAPSHOT is not None:
+            ENTITY_SNAPSHOT.add(self.template, row, display_name)
+        out_file.write(self.formatter(row, self.template, display_name))
+        RUN_COUNTERS['entities'] += 1
+
+    def write_rows(self, out_file):
+        for fragment in self.fragments or ():
+            out_file.write(fragment)
+        for entry in self.row_data:
+            self.write_entry(out_file, entry)
 
     def emit(self, out_dir):
         with open(out_dir+self.data_name+EXT, 'w', newline='', encoding='utf-8') as out_file:
-            for display_name, row in self.row_data:
-                out_file.write(self.formatter(row, self.template, display_name))
+            self.write_rows(out_file)
+        RUN_COUNTERS['bytes'] += os.path.getsize(out_dir+self.data_name+EXT)
+
+    def stream(self, out_dir):
+        """process and emit in one go, writing each entity as soon as it is
+        appended instead of holding the whole table until the end.
+
+        Parsers with BUFFERED_PROCESSING functions hold their rows in a SpilledRows
+        instead, and write them out once every table is processed.
+        """
+        with open(out_dir+self.data_name+EXT, 'w', newline='', encoding='utf-8') as out_file:
+            if self.buffered():
+                self.row_data = SpilledRows()
+                self.process()
+                self.write_rows(out_file)
+                self.row_data.close()
+            else:
+                self.out_file = out_file
+                self.row_data = StreamedRows(functools.partial(self.write_entry, out_file))
+                self.process()
+        RUN_COUNTERS['bytes'] += os.path.getsize(out_dir+self.data_name+EXT)
+
+def render_shard(shard):
+    """Processes and renders the rows of a table from rowid first to last, for DataParser.process_sharded."""
+    results = list(render_rows(*shard))
+    return ''.join(text for text, _, _ in results), sum(rows for _, rows, _ in results), sum(entities for _, _, entities in results)
+
+def render_rows(data_name, template, formatter, func, first=None, last=None):
+    """Processes and renders the rows of a table, or those from rowid first to last,
+    CHUNK_ROWS at a time.
+
+    Goes through the function's COLUMNAR_PROCESSING renderer when it has one and
+    no entity snapshot needs the rows. Yields the text, rows read and entities
+    rendered of each chunk.
+    """
+    query = f"SELECT * FROM {data_name} WHERE {ROW_INDEX} != '0'"
+    params = ()
+    if first is not None:
+        query += " AND rowid BETWEEN ? AND ?"
+        params = (first, last)
+    query += " ORDER BY rowid"
+    stats = QUERY_STATS[query]
+    renderer = COLUMNAR_PROCESSING.get((func, formatter)) if ENTITY_SNAPSHOT is None else None
+    if renderer is not None:
+        start = time.perf_counter()
+        cursor = db.connection.cursor()
+        cursor.row_factory = None
+        db_execute(cursor, query, params)
+        stats[0] += 1
+        stats[1] += time.perf_counter() - start
+        columns = [column[0] for column in cursor.description]
+        while rows := cursor.fetchmany(CHUNK_ROWS):
+            text = renderer(template, columns, rows)
+            if text is None:
+                # The renamed keys collide, which only the row by row path handles like before
+                break
+            yield text, len(rows), len(rows)
+        else:
+            return
+    start = time.perf_counter()
+    cursor = db_execute(db.connection.cursor(), query, params)
+    stats[0] += 1
+    stats[1] += time.perf_counter() - start
+    row_data = KeyedRows()
+    rows = 0
+    for row in cursor:
+        func(row, row_data)
+        rows += 1
+        if rows == CHUNK_ROWS:
+            yield ''.join(formatter(row, template, display_name) for display_name, row in row_data), rows, len(row_data)
+            row_data = KeyedRows()
+            rows = 0
+    if rows:
+        yield ''.join(formatter(row, template, display_name) for display_name, row in row_data), rows, len(row_data)
+
+def reconnect_db():
+    """Gives a forked process a connection of its own to a file-backed database."""
+    global db
+    if mono_db.db_path:
+        mono_db.reconnect()
+        db = mono_db.cursor
 
 class CustomDataParser:
     def __init__(self, _data_name, _processor_params):
@@ -321,11 +730,11 @@ class CustomDataParser:
         self.process_func = _processor_params[0]
         self.extra_files = _processor_params[1:]
 
-    def process(self, in_dir, out_dir):
-        with open(in_dir+self.data_name+EXT, 'r', newline='', encoding='utf-8') as in_file:
-            reader = csv.DictReader(in_file)
-            with open(out_dir+self.data_name+EXT, 'w', newline='', encoding='utf-8') as out_file:
-                self.process_func(reader, out_file, *[in_dir+f+EXT for f in self.extra_files])
+    def process(self, out_dir):
+        with open(out_dir+self.data_name+EXT, 'w', newline='', encoding='utf-8') as out_file:
+            self.process_func(db_iter_table(self.data_name), out_file,
+                              *[db_iter_table(table_name) for table_name in self.extra_files])
+        RUN_COUNTERS['bytes'] += os.path.getsize(out_dir+self.data_name+EXT)
 
 class DatabaseBasedParser:
     def __init__(self, _data_name, _processor_params):
@@ -335,6 +744,463 @@ class DatabaseBasedParser:
     def process(self, out_dir):
         with open(out_dir+self.data_name+EXT, 'w', newline='', encoding='utf-8') as out_file:
             self.process_func(out_file)
+        RUN_COUNTERS['bytes'] += os.path.getsize(out_dir+self.data_name+EXT)
+
+class MonoDatabase:
+    """SQLite copy of every mono in the input directory.
+
+    By default the database lives in memory and is rebuilt on every run. When
+    db_path is given it is kept on disk instead, alongside a record of each
+    source file's size, mtime and content hash, so that unchanged tables are
+    reused as-is, changed tables are rebuilt and removed tables are dropped.
+
+    Columns are declared INTEGER or REAL when every value in them converts
+    losslessly, TEXT otherwise, and rows are stored in numeric _Id order.
+
+    Tables are only ingested the first time a query reads from them, so the
+    cost of a run scales with the tables its processors actually touch rather
+    than with the size of the dump.
+    """
+    META_TABLE = '_MonoMeta'
+    # Bump whenever the way tables are loaded changes, so persisted databases get rebuilt
+    SCHEMA_VERSION = 2
+
+    def __init__(self, in_dir, db_path=None):
+        self.in_dir = in_dir
+        self.db_path = db_path
+        self.con = sqlite3.connect(db_path or ':memory:', cached_statements=CACHED_STATEMENTS)
+        self.con.row_factory = row_factory
+        self.cursor = self.con.cursor()
+        self.typed_cursor = self.con.cursor()
+        self.typed_cursor.row_factory = typed_row_factory
+        if self.typed_cursor.execute('PRAGMA user_version').fetchone()['user_version'] != self.SCHEMA_VERSION:
+            self.cursor.execute(f'DROP TABLE IF EXISTS {self.META_TABLE}')
+            self.cursor.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+        self.cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS {self.META_TABLE} '
+            '(_TableName TEXT PRIMARY KEY, _Size INTEGER, _MTime INTEGER, _Hash TEXT)')
+        self.meta = {row['_TableName']: row for row in
+                     self.typed_cursor.execute(f'SELECT * FROM {self.META_TABLE}').fetchall()}
+        # Tables whose rows could not all be inserted this run, kept as they are but never recorded as current
+        self.failed = set()
+
+    def sync(self):
+        """Brings the database in line with the mono files in in_dir.
+
+        Tables whose source is gone or has changed are dropped, to be loaded
+        again by load_missing if a query asks for them.
+        """
+        self.sources = {os.path.basename(mono).replace(EXT, ''): mono
+                        for mono in glob.glob(f'{self.in_dir}*{EXT}')}
+        reused = 0
+        for table_name in list(self.meta):
+            if table_name in self.sources and self.is_current(table_name, self.sources[table_name]):
+                # Databases persisted before an index was added to TABLE_INDEXES pick it up here
+                self.create_indexes(table_name)
+                reused += 1
+            else:
+                self.drop_table(table_name)
+        # Left behind by a load that failed, so never recorded as current
+        for row in self.typed_cursor.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall():
+            if row['name'] != self.META_TABLE and row['name'] not in self.meta and not row['name'].startswith('sqlite_'):
+                self.cursor.execute(f"DROP TABLE IF EXISTS {row['name']}")
+        self.con.commit()
+        if reused:
+            print('Reused {} unchanged tables'.format(reused))
+
+    def load_missing(self, error):
+        """Loads the table a "no such table" error is about. Returns whether there was one to load."""
+        message = str(error)
+        if not message.startswith('no such table: '):
+            return False
+        table_name = message[len('no such table: '):].split('.')[-1]
+        if table_name not in self.sources or table_name in self.meta or table_name in self.failed:
+            return False
+        self.load_table(table_name, self.sources[table_name])
+        return True
+
+    def is_current(self, table_name, path):
+        meta = self.meta.get(table_name)
+        if not meta:
+            return False
+        stat = os.stat(path)
+        if meta['_Size'] != stat.st_size:
+            return False
+        if meta['_MTime'] == stat.st_mtime_ns:
+            return True
+        # Touched but possibly identical, e.g. after re-extracting the same dump
+        if meta['_Hash'] != file_hash(path):
+            return False
+        self.write_meta(table_name, stat.st_size, stat.st_mtime_ns, meta['_Hash'])
+        self.con.commit()
+        return True
+
+    def load_table(self, table_name, path):
+        stat = os.stat(path)
+        content_hash = file_hash(path)
+        columns, column_types, rows = read_mono(table_name, path)
+        self.create_table(table_name, columns, column_types)
+        if self.insert_rows(table_name, rows):
+            self.create_indexes(table_name, columns)
+            self.write_meta(table_name, stat.st_size, stat.st_mtime_ns, content_hash)
+        self.con.commit()
+
+    def load_all(self, skip=()):
+        """Loads every mono that is not already current, except those in skip."""
+        for table_name, path in self.sources.items():
+            if table_name not in self.meta and table_name not in self.failed and table_name not in skip:
+                self.load_table(table_name, path)
+
+    def load_parallel(self, workers, batch_size=INGEST_BATCH_SIZE, skip=()):
+        """Loads every mono that is not already current, except those in skip, parsing them in worker processes.
+
+        Workers parse and type one file at a time and send its rows back in
+        batches over a bounded queue. A worker still holds a whole parsed file
+        in memory, since typing a column and sorting by _Id need all of its rows.
+        This process is the only writer, and inserts everything in one
+        transaction with journaling turned off. A worker that dies without
+        finishing its file raises RuntimeError instead of leaving this to wait.
+        """
+        pending = [(table_name, path, batch_size) for table_name, path in self.sources.items()
+                   if table_name not in self.meta and table_name not in skip]
+        if not pending:
+            return
+        journal_mode = self.typed_cursor.execute('PRAGMA journal_mode').fetchone()['journal_mode']
+        synchronous = self.typed_cursor.execute('PRAGMA synchronous').fetchone()['synchronous']
+        self.cursor.execute('PRAGMA journal_mode=OFF')
+        self.cursor.execute('PRAGMA synchronous=OFF')
+
+        tasks = multiprocessing.Queue()
+        queue = multiprocessing.Queue(maxsize=workers * 4)
+        for task in pending:
+            tasks.put(task)
+        processes = [multiprocessing.Process(target=ingest_worker, args=(tasks, queue), daemon=True)
+                     for _ in range(min(workers, len(pending)))]
+        for process in processes:
+            tasks.put(None)
+            process.start()
+        table_columns = {}
+        remaining = len(pending)
+        try:
+            while remaining:
+                try:
+                    message, table_name, *payload = queue.get(timeout=INGEST_POLL_SECONDS)
+                except Empty:
+                    failed = [process for process in processes if process.exitcode not in (None, 0)]
+                    if failed:
+                        raise RuntimeError('Ingest worker exited with code {}'.format(failed[0].exitcode))
+                    if all(process.exitcode == 0 for process in processes):
+                        raise RuntimeError('Ingest workers exited with {} monos unfinished'.format(remaining))
+                    continue
+                if message == 'create':
+                    table_columns[table_name] = payload[0]
+                    self.create_table(table_name, *payload)
+                elif message == 'rows':
+                    if table_name not in self.failed:
+                        self.insert_rows(table_name, payload[0])
+                elif message == 'done':
+                    if table_name not in self.failed:
+                        self.create_indexes(table_name, table_columns[table_name])
+                        self.write_meta(table_name, *payload)
+                    remaining -= 1
+                else:
+                    print('Error in input csv: {}'.format(table_name))
+                    print(payload[0])
+                    self.failed.add(table_name)
+                    remaining -= 1
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+        self.con.commit()
+
+        self.cursor.execute(f'PRAGMA journal_mode={journal_mode}')
+        self.cursor.execute(f'PRAGMA synchronous={synchronous}')
+
+    def create_table(self, table_name, columns, column_types):
+        column_defs = ','.join(f'{column} {column_type}' for column, column_type in zip(columns, column_types))
+        self.cursor.execute(f'DROP TABLE IF EXISTS {table_name}')
+        self.cursor.execute(f'CREATE TABLE {table_name} ({column_defs})')
+
+    def insert_rows(self, table_name, rows):
+        """Inserts rows into a table, returning False, with the table marked failed, if they could not be."""
+        if not rows:
+            return True
+        placeholder = ','.join(["?" for i in rows[0]])
+        try:
+            self.cursor.executemany(f'INSERT INTO {table_name} VALUES ({placeholder})', rows)
+        except:
+            print('Error in input csv: {}'.format(table_name))
+            traceback.print_exc()
+            self.failed.add(table_name)
+            return False
+        return True
+
+    def create_indexes(self, table_name, columns=None):
+        if columns is None:
+            columns = [row['name'] for row in self.cursor.execute(f'PRAGMA table_info({table_name})').fetchall()]
+        for column in (ROW_INDEX,) + TABLE_INDEXES.get(table_name, ()):
+            if column in columns:
+                self.cursor.execute(
+                    f'CREATE INDEX IF NOT EXISTS idx_{table_name}{column} ON {table_name} ({column})')
+
+    def drop_table(self, table_name):
+        self.cursor.execute(f'DROP TABLE IF EXISTS {table_name}')
+        self.cursor.execute(f'DELETE FROM {self.META_TABLE} WHERE _TableName=?', (table_name,))
+        del self.meta[table_name]
+        self.con.commit()
+
+    def write_meta(self, table_name, size, mtime, content_hash):
+        self.cursor.execute(
+            f'INSERT OR REPLACE INTO {self.META_TABLE} VALUES (?,?,?,?)',
+            (table_name, size, mtime, content_hash))
+        self.meta[table_name] = {'_TableName': table_name, '_Size': size,
+                                 '_MTime': mtime, '_Hash': content_hash}
+
+    def has_table(self, table_name):
+        return table_name in self.sources
+
+    def reconnect(self):
+        """Opens a new connection to the same file, for a forked process that must not share the old one."""
+        self.con = sqlite3.connect(self.db_path, cached_statements=CACHED_STATEMENTS)
+        self.con.row_factory = row_factory
+        self.cursor = self.con.cursor()
+        self.typed_cursor = self.con.cursor()
+        self.typed_cursor.row_factory = typed_row_factory
+
+def read_mono(table_name, path):
+    """Parses a mono into its column names, inferred column types and typed rows."""
+    with open(path, encoding='utf-8', newline='') as file:
+        dialect = 'excel-tab' if 'TextLabel' in table_name else 'excel'
+        reader = csv.reader(file, dialect=dialect)
+        columns = next(reader)
+        rows = [tuple(row) for row in reader]
+    column_types, rows = typed_columns(columns, rows)
+    return columns, column_types, rows
+
+def ingest_worker(tasks, queue):
+    """Runs as a MonoDatabase.load_parallel worker, ingesting monos from tasks until it gets None."""
+    for table_name, path, batch_size in iter(tasks.get, None):
+        ingest_mono(table_name, path, batch_size, queue)
+
+def ingest_mono(table_name, path, batch_size, ingest_queue):
+    """Sends a parsed mono back to MonoDatabase.load_parallel in batches."""
+    try:
+        stat = os.stat(path)
+        content_hash = file_hash(path)
+        columns, column_types, rows = read_mono(table_name, path)
+    except Exception:
+        ingest_queue.put(('error', table_name, traceback.format_exc()))
+        return
+    ingest_queue.put(('create', table_name, columns, column_types))
+    for start in range(0, len(rows), batch_size):
+        ingest_queue.put(('rows', table_name, rows[start:start+batch_size]))
+    ingest_queue.put(('done', table_name, stat.st_size, stat.st_mtime_ns, content_hash))
+
+INTEGER_REGEX = re.compile(r'0|-?[1-9]\d*')
+REAL_REGEX = re.compile(r'-?\d+\.\d+(?:e-?\d+)?')
+
+def column_type(values):
+    """Narrowest SQLite type every value in the column converts to and back from unchanged."""
+    if all(INTEGER_REGEX.fullmatch(v) and -(1 << 63) <= int(v) < (1 << 63) for v in values):
+        return 'INTEGER'
+    if all(REAL_REGEX.fullmatch(v) and repr(float(v)) == v for v in values):
+        return 'REAL'
+    return 'TEXT'
+
+def typed_columns(columns, rows):
+    """Infers the type of each column and returns it alongside the converted rows, sorted by _Id."""
+    if not rows or any(len(row) != len(columns) for row in rows):
+        # Malformed input is inserted as-is, to fail the same way it always has
+        return ['TEXT'] * len(columns), rows
+    column_types = []
+    converted = []
+    for values in zip(*rows):
+        column_types.append(column_type(values))
+        if column_types[-1] == 'INTEGER':
+            converted.append(map(int, values))
+        elif column_types[-1] == 'REAL':
+            converted.append(map(float, values))
+        else:
+            converted.append(values)
+    rows = list(zip(*converted))
+    if ROW_INDEX in columns and column_types[columns.index(ROW_INDEX)] == 'INTEGER':
+        id_idx = columns.index(ROW_INDEX)
+        rows.sort(key=lambda row: row[id_idx])
+    return column_types, rows
+
+def file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as in_file:
+        for chunk in iter(lambda: in_file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class LabelStore(Mapping):
+    """Read-only TextLabel lookup, backed by a compact memory-mapped file instead of a dict.
+
+    The file holds every key sorted as utf-8, the values in the same order and
+    the offsets of both, so a lookup is a binary search over the mapping and
+    only the labels actually looked up are ever decoded. It is named after the
+    hash of the mono it was built from, so with a persistent label_dir it is
+    only built once per dump. Without one it lives in a temporary directory for
+    as long as the store does.
+    """
+    MAGIC = b'DLLABEL1'
+    HEADER = struct.Struct('<8sII')
+
+    def __init__(self, path, tmp_dir=None):
+        self.path = path
+        self.tmp_dir = tmp_dir
+        with open(path, 'rb') as in_file:
+            self.mm = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, _ = self.HEADER.unpack_from(self.mm)
+        if magic != self.MAGIC:
+            raise ValueError('Not a label store: {}'.format(path))
+        offsets_size = (self.count + 1) * 4
+        view = memoryview(self.mm)
+        start = self.HEADER.size
+        self.key_offsets = view[start:start+offsets_size].cast('I')
+        start += offsets_size
+        self.value_offsets = view[start:start+offsets_size].cast('I')
+        self.keys_start = start + offsets_size
+        self.values_start = self.keys_start + self.key_offsets[self.count]
+        # Decoded results of lookups so far, None for misses: raw, and normalized for display
+        self.found = {}
+        self.labels = {}
+
+    @classmethod
+    def build(cls, mono_path, label_dir=None):
+        """Opens the store for a TextLabel mono, building it first if label_dir does not have it yet."""
+        tmp_dir = None
+        if label_dir is None:
+            tmp_dir = tempfile.TemporaryDirectory(prefix='dl-labels-')
+            label_dir = tmp_dir.name
+        os.makedirs(label_dir, exist_ok=True)
+        table_name = os.path.basename(mono_path).replace(EXT, '')
+        path = os.path.join(label_dir, '{}-{}.labels'.format(table_name, file_hash(mono_path)))
+        if not os.path.exists(path):
+            for old_path in glob.glob(os.path.join(label_dir, table_name + '-*.labels')):
+                os.remove(old_path)
+            cls.write(mono_path, path)
+        return cls(path, tmp_dir)
+
+    @classmethod
+    def write(cls, mono_path, path):
+        with open(mono_path, encoding='utf-8', newline='') as in_file:
+            reader = csv.reader(in_file, dialect='excel-tab')
+            columns = next(reader)
+            key_idx, text_idx = columns.index(ROW_INDEX), columns.index('_Text')
+            labels = {row[key_idx].encode('utf-8'): row[text_idx].encode('utf-8')
+                      for row in reader if len(row) > text_idx}
+        keys = sorted(labels)
+        key_offsets = array('I', [0])
+        value_offsets = array('I', [0])
+        for key in keys:
+            key_offsets.append(key_offsets[-1] + len(key))
+            value_offsets.append(value_offsets[-1] + len(labels[key]))
+        # Written next to the final file and renamed into place, so a store is never seen half written
+        tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+        with open(tmp_path, 'wb') as out_file:
+            out_file.write(cls.HEADER.pack(cls.MAGIC, len(keys), 0))
+            out_file.write(key_offsets.tobytes())
+            out_file.write(value_offsets.tobytes())
+            out_file.write(b''.join(keys))
+            out_file.write(b''.join(labels[key] for key in keys))
+        os.replace(tmp_path, path)
+
+    def key_at(self, idx):
+        return self.mm[self.keys_start+self.key_offsets[idx]:self.keys_start+self.key_offsets[idx+1]]
+
+    def value_at(self, idx):
+        return self.mm[self.values_start+self.value_offsets[idx]:self.values_start+self.value_offsets[idx+1]].decode('utf-8')
+
+    def lookup(self, key):
+        target = key.encode('utf-8')
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.key_at(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count and self.key_at(lo) == target:
+            return self.value_at(lo)
+        return None
+
+    def get(self, key, default=None):
+        try:
+            value = self.found[key]
+        except KeyError:
+            value = self.found[key] = self.lookup(key)
+        return default if value is None else value
+
+    def label(self, key):
+        """The label normalized for display, with escaped newlines as spaces, or None if missing.
+
+        Each key is normalized once; after that get_label reads it straight from self.labels.
+        """
+        value = self.get(key)
+        if value is not None:
+            value = value.replace('\\n', ' ')
+        self.labels[key] = value
+        return value
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __iter__(self):
+        return (self.key_at(idx).decode('utf-8') for idx in range(self.count))
+
+    def __len__(self):
+        return self.count
+
+class TextLabels(dict):
+    """TEXT_LABEL_DICT: language -> LabelStore, each opened the first time it is asked for.
+
+    A dict, so that looking up a language that is already open stays a plain dict lookup.
+    """
+    def __init__(self, sources, label_dir=None, stores=None):
+        super().__init__()
+        self.sources = sources
+        self.label_dir = label_dir
+        self.stores = {} if stores is None else stores
+
+    def __missing__(self, lang):
+        try:
+            store = self.stores[lang]
+        except KeyError:
+            store = self.stores[lang] = LabelStore.build(self.sources[lang], self.label_dir)
+        self[lang] = store
+        track_tables(os.path.basename(self.sources[lang]).replace(EXT, ''))
+        return store
+
+    def view(self):
+        """A TextLabels sharing this one's stores, that reports each language's table the first time it is used."""
+        return TextLabels(self.sources, self.label_dir, self.stores)
+
+    def __contains__(self, lang):
+        return lang in self.sources
+
+    def __iter__(self):
+        return iter(self.sources)
+
+    def __len__(self):
+        return len(self.sources)
+
+def db_as_index(table, index='_Id', value_key=None):
+    """Same as csv_as_index, but reads an already loaded table from the database."""
+    rows = db_query_all(f'SELECT * FROM {table}')
+    if value_key:
+        return {row[index]: row[value_key] for row in rows if row[index] != '0'}
+    return {row[index]: row for row in rows if row[index] != '0'}
 
 def csv_as_index(path, index=None, value_key=None, tabs=False):
     with open(path, 'r', newline='', encoding='utf-8') as csvfile:
@@ -356,13 +1222,170 @@ def csv_as_index(path, index=None, value_key=None, tabs=False):
             # load >2 column files as a dict[string] = OrderedDict
             return {row[index]: row for row in reader if row[index] != '0'}
 
+class ResolverCache:
+    """Bounded LRU of a lookup helper's results, with hit/miss counts.
+
+    Time saved is estimated as the number of hits times the average time a miss took.
+    """
+    def __init__(self, func, maxsize):
+        self.func = func
+        self.maxsize = maxsize
+        self.results = OrderedDict()
+        # Every table a miss read, reported by hits as well while recording tables
+        self.tables = set()
+        self.hits = 0
+        self.misses = 0
+        self.miss_time = 0.0
+
+    def __call__(self, *args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+        try:
+            result = self.results[key]
+        except KeyError:
+            start = time.perf_counter()
+            if TABLES_READ is None:
+                result = self.func(*args, **kwargs)
+            else:
+                result = call_tracked(self.tables, self.func, *args, **kwargs)
+            self.miss_time += time.perf_counter() - start
+            self.misses += 1
+            self.results[key] = result
+            if len(self.results) > self.maxsize:
+                self.results.popitem(last=False)
+            return result
+        self.results.move_to_end(key)
+        self.hits += 1
+        if TABLES_READ is not None:
+            TABLES_READ.update(self.tables)
+        return result
+
+    def clear(self):
+        self.results.clear()
+        self.tables.clear()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.miss_time = 0.0
+
+    @property
+    def time_saved(self):
+        return self.hits * self.miss_time / self.misses if self.misses else 0.0
+
+def call_tracked(tables, func, *args, **kwargs):
+    """Calls func while recording the tables it reads into tables, so that cached
+    results can report them too. Only to be used while recording tables.
+    """
+    global TABLES_READ, TEXT_LABEL_DICT
+    outer_tables, outer_labels = TABLES_READ, TEXT_LABEL_DICT
+    TABLES_READ, TEXT_LABEL_DICT = set(), TEXT_LABEL_DICT.view()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        tables |= TABLES_READ
+        outer_tables |= TABLES_READ
+        TABLES_READ, TEXT_LABEL_DICT = outer_tables, outer_labels
+
+def resolver_cache(func=None, maxsize=RESOLVER_CACHE_SIZE):
+    """Caches a lookup helper whose result only depends on its arguments and the loaded monos.
+
+    Every cache is cleared by clear_resolver_caches when the database is (re)loaded.
+    """
+    if func is None:
+        return functools.partial(resolver_cache, maxsize=maxsize)
+    cache = ResolverCache(func, maxsize)
+    functools.update_wrapper(cache, func)
+    RESOLVER_CACHES[func.__name__] = cache
+    return cache
+
+def clear_resolver_caches():
+    for cache in RESOLVER_CACHES.values():
+        cache.clear()
+
+def resolver_stats():
+    return {name: (cache.hits, cache.misses, cache.miss_time) for name, cache in RESOLVER_CACHES.items()}
+
+def merge_resolver_stats(stats):
+    for name, (hits, misses, miss_time) in stats.items():
+        cache = RESOLVER_CACHES[name]
+        cache.hits += hits
+        cache.misses += misses
+        cache.miss_time += miss_time
+
+def print_resolver_stats():
+    called = {name: cache for name, cache in RESOLVER_CACHES.items() if cache.hits + cache.misses}
+    if not called:
+        return
+    print('{:<20} {:>8} {:>8} {:>9} {:>10}'.format('Resolver', 'Hits', 'Misses', 'Hit rate', 'Saved ms'))
+    for name, cache in called.items():
+        calls = cache.hits + cache.misses
+        print('{:<20} {:>8} {:>8} {:>8.1%} {:>10.1f}'.format(
+            name, cache.hits, cache.misses, cache.hits / calls, cache.time_saved * 1000))
+
 def get_label(key, lang='en'):
     try:
         txt_label = TEXT_LABEL_DICT[lang]
     except KeyError:
         txt_label = TEXT_LABEL_DICT['en']
-    return (txt_label.get(key, DEFAULT_TEXT_LABEL) or DEFAULT_TEXT_LABEL).replace('\\n', ' ')
+    try:
+        return txt_label.labels[key] or DEFAULT_TEXT_LABEL
+    except KeyError:
+        return txt_label.label(key) or DEFAULT_TEXT_LABEL
+
+class LabelTemplate:
+    """A label with {placeholders}, parsed once into literal text and the fields between it.
+
+    Placeholders without a value are left in the output as written instead of
+    raising like str.format, as is a label whose braces do not parse at all.
+    """
+    def __init__(self, text):
+        # (literal text, field name or None, placeholder as written, whether the field can be substituted as is)
+        self.parts = []
+        try:
+            for literal, name, spec, conversion in string.Formatter().parse(text):
+                if name is None:
+                    self.parts.append((literal, None, None, False))
+                    continue
+                placeholder = '{' + name + ('!' + conversion if conversion else '') + (':' + spec if spec else '') + '}'
+                self.parts.append((literal, name, placeholder, name.isidentifier() and not spec and not conversion))
+        except ValueError:
+            self.parts = [(text, None, None, False)]
+        self.fields = {name for _, name, _, _ in self.parts if name is not None}
+
+    def render(self, values):
+        result = []
+        for literal, name, placeholder, simple in self.parts:
+            result.append(literal)
+            if name is None:
+                continue
+            if simple:
+                result.append(str(values[name]) if name in values else placeholder)
+            else:
+                try:
+                    result.append(placeholder.format_map(values))
+                except (KeyError, IndexError, AttributeError, ValueError):
+                    result.append(placeholder)
+        return ''.join(result)
+
+def format_label(text, values, squeeze_spaces=False, bold_percentages=False):
+    """Fills a label's placeholders from values, compiling each distinct label only once.
 
+    squeeze_spaces collapses the double spaces left by empty values, and
+    bold_percentages bolds every ' n%' in the result.
+    """
+    try:
+        template = LABEL_TEMPLATES[text]
+    except KeyError:
+        template = LABEL_TEMPLATES[text] = LabelTemplate(text)
+    result = template.render(values)
+    if squeeze_spaces:
+        result = result.replace('  ', ' ')
+    if bold_percentages and '%' in result:
+        result = PERCENTAGE_REGEX.sub(r" '''\1%'''", result)
+    return result
+
+@resolver_cache
 def get_item_label(type, key):
     try:
         label_key = ITEM_NAMES[type][key]
@@ -370,30 +1393,32 @@ def get_item_label(type, key):
     except KeyError:
         return key
 
+@resolver_cache
 def get_label_by_field(key, table, field='_Name'):
     try:
         return get_label(
             db_query_one(
-                f"SELECT {field} FROM {table} WHERE _Id='{key}'")['_Name']
+                f"SELECT {field} FROM {table} WHERE _Id=?", (key,))['_Name']
             )
     except:
         return key
 
+@resolver_cache
 def get_dmode_item(key):
     result = db_query_one(
-        f"SELECT * FROM DmodeDungeonItemData WHERE _Id='{key}'")
+        "SELECT * FROM DmodeDungeonItemData WHERE _Id=?", (key,))
     itemtype = result['_DmodeDungeonItemType']
     target_id = result['_DungeonItemTargetId']
 
     # DmodeDungeonItemType.cs
     if itemtype == '1':
-        dragon = db_query_one(f"SELECT _Name FROM DragonData WHERE _Id='{target_id}'")
+        dragon = db_query_one("SELECT _Name FROM DragonData WHERE _Id=?", (target_id,))
         return {'type': 'Dragon', 'label': get_label(dragon['_Name'])}
     elif itemtype == '2':
         weapon = db_query_one(
             "SELECT ws._Name FROM DmodeWeapon dw "
             "JOIN WeaponSkin ws ON dw._WeaponSkinId = ws._Id "
-            f"WHERE dw._Id='{target_id}'"
+            "WHERE dw._Id=?", (target_id,)
         )
         return {
             'type': 'Weapon',
@@ -403,7 +1428,7 @@ def get_dmode_item(key):
         wp = db_query_one(
             "SELECT ac._Name FROM DmodeAbilityCrest dac "
             "JOIN AbilityCrest ac ON dac._AbilityCrestId = ac._Id "
-            f"WHERE dac._Id='{target_id}'"
+            "WHERE dac._Id=?", (target_id,)
         )
         return {
             'type': 'Wyrmprint',
@@ -414,9 +1439,11 @@ def get_dmode_item(key):
 
     return {'type': 'KaleidoscapeItem', 'label': key}
 
+@resolver_cache
 def get_chara_name(chara_id):
     return get_label('CHARA_NAME_COMMENT_' + chara_id) or get_label('CHARA_NAME_' + chara_id)
 
+@resolver_cache
 def get_dragon_name(dragon_id):
     return get_label('DRAGON_NAME_COMMENT_' + dragon_id) or get_label('DRAGON_NAME_' + dragon_id)
 
@@ -431,18 +1458,182 @@ def get_jp_epithet(emblem_id):
             get_label(EMBLEM_P + emblem_id, lang='jp')) + '}}'
     return ''
 
+@resolver_cache
 def get_epithet_rarity(emblem_id):
-    return db_query_one(f"SELECT _Rarity FROM EmblemData WHERE _Id='{emblem_id}'")['_Rarity']
+    return db_query_one("SELECT _Rarity FROM EmblemData WHERE _Id=?", (emblem_id,))['_Rarity']
 
 # Formats= 0: icon + text, 1: text only, 2: category
 def get_entity_item(item_type, item_id, format=1):
-    try:
-        if item_type == '0':
-            return ''
-        return ENTITY_TYPE_DICT[item_type][format](item_id)
-    except KeyError:
+    if item_type == '0':
+        return ''
+    return ENTITY_CATALOG.lookup(item_type, item_id, format)
+
+class EntityCatalog:
+    """(entity type, entity id, format) -> the icon markup, name or category
+    get_entity_item returns, worked out once per run instead of for every cell
+    naming the entity.
+
+    Each format is only resolved when it is asked for, same as before there
+    was a catalog. While recording tables, the tables a type's lookups read are
+    kept and reported by each of its lookups, same as the resolver caches do.
+    build fills in every entity listed in the ENTITY_TABLES tables, for write.
+    """
+    def __init__(self):
+        self.entries = {}
+        self.tables = defaultdict(set)
+
+    def lookup(self, item_type, item_id, format):
+        tables = self.tables[item_type]
+        if TABLES_READ is not None:
+            TABLES_READ.update(tables)
+        try:
+            return self.entries[item_type, item_id, format]
+        except KeyError:
+            if TABLES_READ is None:
+                value = self.resolve(item_type, item_id, format)
+            else:
+                value = call_tracked(tables, self.resolve, item_type, item_id, format)
+            self.entries[item_type, item_id, format] = value
+            return value
+
+    def resolve(self, item_type, item_id, format):
+        try:
+            return ENTITY_TYPE_DICT[item_type][format](item_id)
+        except KeyError:
+            return self.unresolved(item_type, item_id)
+
+    @staticmethod
+    def unresolved(item_type, item_id):
         return 'Entity type {}: {}'.format(item_type, item_id)
 
+    def build(self):
+        """Resolves every format of every entity listed in the ENTITY_TABLES tables."""
+        for item_type, formats in ENTITY_TYPE_DICT.items():
+            table = ENTITY_TABLES.get(item_type, '')
+            if table is None:
+                item_ids = ['0']
+            elif mono_db.has_table(table):
+                item_ids = [row[ROW_INDEX] for row in db_query_all(f"SELECT {ROW_INDEX} FROM {table} WHERE {ROW_INDEX} != '0'")]
+            else:
+                item_ids = []
+            for item_id in item_ids:
+                for format in range(len(formats)):
+                    self.lookup(item_type, item_id, format)
+
+    def catalog(self):
+        """Every entity resolved so far as (type, id, icon, name, category), sorted.
+
+        Entities of unknown types, or that did not resolve, are left out.
+        """
+        entities = sorted({(item_type, item_id) for item_type, item_id, _ in self.entries if item_type in ENTITY_TYPE_DICT},
+                          key=lambda entity: (int(entity[0]), entity[1]))
+        for item_type, item_id in entities:
+            entry = tuple(self.lookup(item_type, item_id, format) for format in range(3))
+            if self.unresolved(item_type, item_id) not in entry:
+                yield (item_type, item_id) + entry
+
+    def write(self, path):
+        """Writes the catalog to a JSON file, or an SQLite database for any other extension."""
+        if os.path.splitext(path)[1] == '.json':
+            catalog = defaultdict(dict)
+            for item_type, item_id, icon, name, category in self.catalog():
+                catalog[item_type][item_id] = {'Icon': icon, 'Name': name, 'Category': category}
+            with open(path, 'w', encoding='utf-8') as out_file:
+                json.dump(catalog, out_file, ensure_ascii=False, indent=2)
+            return
+        if os.path.exists(path):
+            os.remove(path)
+        con = sqlite3.connect(path)
+        con.execute(
+            'CREATE TABLE EntityCatalog '
+            '(_EntityType TEXT, _EntityId TEXT, _Icon TEXT, _Name TEXT, _Category TEXT, '
+            'PRIMARY KEY (_EntityType, _EntityId))')
+        con.executemany('INSERT INTO EntityCatalog VALUES (?, ?, ?, ?, ?)', list(self.catalog()))
+        con.commit()
+        con.close()
+
+ENTITY_CATALOG = EntityCatalog()
+
+class LabelProfiler:
+    """Opt-in instrumentation of the label helpers, reported per processor.
+
+    While installed, each profiled helper is replaced by a wrapper that counts
+    its calls, misses and time, and which keys it was asked for, under the
+    processor named by CURRENT_PROCESSOR. What counts as a miss depends on the
+    helper, see PROFILED_HELPERS.
+    """
+    # helper name -> test of (args, result) for a missing or empty label
+    PROFILED_HELPERS = {
+        'get_label': lambda args, result: result == DEFAULT_TEXT_LABEL,
+        'get_item_label': lambda args, result: result == args[1],
+        'get_entity_item': lambda args, result: not result or result.startswith('Entity type '),
+    }
+
+    def __init__(self, top_n=LABEL_PROFILE_TOP_N):
+        self.top_n = top_n
+        self.stats = defaultdict(dict)
+        self.originals = {}
+
+    def install(self):
+        module = globals()
+        for name, is_miss in self.PROFILED_HELPERS.items():
+            self.originals[name] = module[name]
+            module[name] = self.wrap(name, module[name], is_miss)
+
+    def uninstall(self):
+        globals().update(self.originals)
+        self.originals = {}
+
+    def wrap(self, name, func, is_miss):
+        @functools.wraps(func)
+        def profiled(*args, **kwargs):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            stats = self.stats[CURRENT_PROCESSOR].get(name)
+            if stats is None:
+                stats = self.stats[CURRENT_PROCESSOR][name] = {
+                    'calls': 0, 'misses': 0, 'seconds': 0.0, 'keys': Counter(), 'missed_keys': Counter()}
+            key = '/'.join(str(arg) for arg in args + tuple(kwargs.values()))
+            stats['calls'] += 1
+            stats['seconds'] += elapsed
+            stats['keys'][key] += 1
+            if is_miss(args, result):
+                stats['misses'] += 1
+                stats['missed_keys'][key] += 1
+            return result
+        return profiled
+
+    def merge(self, stats):
+        """Adds the stats of a profiler that ran in another process."""
+        for processor, helpers in stats.items():
+            for name, other in helpers.items():
+                ours = self.stats[processor].get(name)
+                if ours is None:
+                    self.stats[processor][name] = other
+                    continue
+                for field in ('calls', 'misses', 'seconds'):
+                    ours[field] += other[field]
+                ours['keys'].update(other['keys'])
+                ours['missed_keys'].update(other['missed_keys'])
+
+    def report(self):
+        return {
+            processor: {
+                name: {
+                    'calls': stats['calls'],
+                    'misses': stats['misses'],
+                    'seconds': round(stats['seconds'], 6),
+                    'top_keys': stats['keys'].most_common(self.top_n),
+                    'top_missed_keys': stats['missed_keys'].most_common(self.top_n),
+                } for name, stats in helpers.items()
+            } for processor, helpers in self.stats.items()
+        }
+
+    def write(self, path):
+        with open(path, 'w', encoding='utf-8') as out_file:
+            json.dump(self.report(), out_file, ensure_ascii=False, indent=2)
+
 def get_quest_title(quest_type, quest_id):
   if quest_type == '2':  # Story
     return get_label('STORY_QUEST_NAME_' + quest_id)
@@ -459,7 +1650,7 @@ def get_quest_title(quest_type, quest_id):
 def process_AbilityLimitedGroup(row, existing_data):
     new_row = OrderedDict()
     copy_without_entriesKey(new_row, row)
-    new_row['AbilityLimitedText'] = get_label(row['_AbilityLimitedText']).format(ability_limit0=row['_MaxLimitedValue'])
+    new_row['AbilityLimitedText'] = format_label(get_label(row['_AbilityLimitedText']), {'ability_limit0': row['_MaxLimitedValue']})
     existing_data.append((None, new_row))
 
 def process_AbilityShiftGroup(row, existing_data, ability_shift_groups):
@@ -492,12 +1683,12 @@ def process_AbilityData(row, existing_data, ability_shift_groups):
     if weapon_type < len(WEAPON_TYPE):
         weapon_owner = WEAPON_TYPE[weapon_type] or weapon_owner
 
-    name = get_label(row['_Name']).format(
-        ability_shift0  =   ROMAN_NUMERALS[shift_value], # heck
-        ability_val0    =   ability_value,
-        element_owner   =   ELEMENT_TYPE.get(row['_ElementalType'], '') or '{element_owner}',
-        weapon_owner    =   weapon_owner
-    )
+    name = format_label(get_label(row['_Name']), {
+        'ability_shift0':   ROMAN_NUMERALS[shift_value], # heck
+        'ability_val0':     ability_value,
+        'element_owner':    ELEMENT_TYPE.get(row['_ElementalType'], '') or '{element_owner}',
+        'weapon_owner':     weapon_owner,
+    })
     # guess the generic name by chopping off the last word, which is usually +n% or V
     new_row['GenericName'] = name[:name.rfind(' ')].replace('%', '')
     new_row['Name'] = name
@@ -510,13 +1701,12 @@ def process_AbilityData(row, existing_data, ability_shift_groups):
         element = ELEMENT_TYPE[row['_ElementalType']]
         if element == 'None':
             element = 'EDIT_THIS'
-    new_row['Details'] = detail_label.format(
-        ability_cond0   =   row['_ConditionValue'],
-        ability_val0    =   ability_value,
-        element_owner   =   element,
-        weapon_owner    =   weapon_owner
-    )
-    new_row['Details'] = PERCENTAGE_REGEX.sub(r" '''\1%'''", new_row['Details'])
+    new_row['Details'] = format_label(detail_label, {
+        'ability_cond0':    row['_ConditionValue'],
+        'ability_val0':     ability_value,
+        'element_owner':    element,
+        'weapon_owner':     weapon_owner,
+    }, bold_percentages=True)
 
     new_row['Effects'] = '' # TODO
     new_row['AbilityIconName'] = row['_AbilityIconName']
@@ -534,8 +1724,7 @@ def process_ChainCoAbility(row, existing_data):
 
     ability_value = (EDIT_THIS if row['_AbilityType1UpValue'] == '0'
                                else row['_AbilityType1UpValue'])
-    new_row['Name'] = get_label(row['_Name']).format(
-        ability_val0 = ability_value)
+    new_row['Name'] = format_label(get_label(row['_Name']), {'ability_val0': ability_value})
     # guess the generic name by chopping off the last word, which is usually +n% or V
     new_row['GenericName'] = new_row['Name'][:new_row['Name'].rfind(' ')].replace('%', '')
 
@@ -545,11 +1734,11 @@ def process_ChainCoAbility(row, existing_data):
         element = new_row['Name'][1:new_row['Name'].index(')')]
     else:
         element = ELEMENT_TYPE[row['_ElementalType']]
-    new_row['Details'] = detail_label.format(
-        ability_cond0   =   row['_ConditionValue'],
-        ability_val0    =   ability_value,
-        element_owner   =   element).replace('  ', ' ')
-    new_row['Details'] = PERCENTAGE_REGEX.sub(r" '''\1%'''", new_row['Details'])
+    new_row['Details'] = format_label(detail_label, {
+        'ability_cond0':    row['_ConditionValue'],
+        'ability_val0':     ability_value,
+        'element_owner':    element,
+    }, squeeze_spaces=True, bold_percentages=True)
     new_row['Effects'] = '' # TODO
     new_row['AbilityIconName'] = row['_AbilityIconName']
 
@@ -560,6 +1749,7 @@ def process_AbilityCrest(out_file):
         "SELECT * FROM AbilityCrest "
         "WHERE _Id!='0' "
         "ORDER BY CAST(_Id as INT)")
+    trades = db_group_by('AbilityCrestTrade', '_AbilityCrestId')
 
     for row in results:
         new_row = OrderedDict()
@@ -597,8 +1787,7 @@ def process_AbilityCrest(out_file):
         new_row['AbilityCrestLevelRarityGroupId'] = row['_AbilityCrestLevelRarityGroupId']
 
         # Trade/obtain info
-        trade = db_query_one('SELECT * FROM AbilityCrestTrade '
-                            f'WHERE _AbilityCrestId="{row["_Id"]}"')
+        trade = next(iter(trades.get(row['_Id'], ())), None)
 
         if trade:
             new_row['NeedDewPoint'] = trade['_NeedDewPoint']
@@ -659,6 +1848,10 @@ def process_AlbumStory(out_file):
         "SELECT asg.* FROM AlbumStoryGroup asg "
         "WHERE asg._Id!='0' "
         "ORDER BY CAST(asg._SortId as INT)")
+    characters = {c['_Id']: c for c in db_query_in(
+        "SELECT _Id,_IsPlayable FROM CharaData WHERE _Id IN ({})",
+        [group[f'_ViewEntityId{i}'] for group in groups for i in range(1,9)
+         if group[f'_ViewEntityType{i}'] == '1'])}
 
     for group in groups:
         row = OrderedDict()
@@ -667,7 +1860,7 @@ def process_AlbumStory(out_file):
             albumId = group['_Id']
             chapter_num = db_query_one(
                 "SELECT _ChapterNum FROM QuestMainGroup "
-                f"WHERE _Id='{albumId}'")['_ChapterNum']
+                "WHERE _Id=?", (albumId,))['_ChapterNum']
             row['Name'] = 'Chapter ' + chapter_num
         else:
             row['Name'] = get_label('EVENT_NAME_' + group['_Id'])
@@ -686,10 +1879,7 @@ def process_AlbumStory(out_file):
             entity_type = group[f'_ViewEntityType{i}']
             if entity_type == '1':
                 cid = group[f'_ViewEntityId{i}']
-                character = db_query_one(
-                    "SELECT _IsPlayable FROM CharaData "
-                    f"WHERE _Id='{cid}'"
-                )
+                character = characters.get(cid)
                 if not character or character['_IsPlayable'] == '1':
                     character_ids.append(cid)
                 else:
@@ -797,7 +1987,7 @@ def process_DmodeServitorPassiveLevel(row, existing_data):
 
     new_row['Id'] = row['_Id']
     new_row['Num'] = row['_PassiveNum']
-    new_row['Detail'] = get_label(row['_PassiveDetail']).format(ability_val0 = row['_UpValue'])
+    new_row['Detail'] = format_label(get_label(row['_PassiveDetail']), {'ability_val0': row['_UpValue']})
     new_row['Level'] = row['_Level']
     new_row['UpValue'] = row['_UpValue']
 
@@ -853,7 +2043,7 @@ def process_DmodeEnemies(out_file):
             "JOIN EnemyData ed ON ed._Id=ep._DataId "
             "JOIN EnemyList el ON ed._BookId=el._id "
         "WHERE ep._DmodeEnemyParamGroupId!='0' "
-        "ORDER BY ep._Id")
+        "ORDER BY CAST(ep._Id as INT)")
     for e in enemies:
         new_row = OrderedDict()
         new_row['Id'] = e['_Id']
@@ -1152,12 +2342,13 @@ def process_CharaData(row, existing_data, chara_mode_data):
 def process_NPC(out_file):
     results = db_query_all(
         "SELECT * FROM CharaData "
-        "WHERE _IsPlayable='0' AND _Id!='0' AND _Id<'99' "
+        # Character and dragon ids are 8 digits, so these match the 99/299 id prefixes and below
+        "WHERE _IsPlayable='0' AND _Id!='0' AND _Id<99000000 "
         "ORDER BY CAST(_Id as INT)")
     results.extend(
         db_query_all(
             "SELECT * FROM DragonData "
-            "WHERE _IsPlayable='0' AND _Id!='0' AND _Id<'299' "
+            "WHERE _IsPlayable='0' AND _Id!='0' AND _Id<29900000 "
             "ORDER BY CAST(_Id as INT)")
     )
 
@@ -1213,12 +2404,10 @@ def process_TalismanData(out_file):
         out_file.write('\n')
 
 def process_SkillDataNames(row, existing_data):
-    for idx, (name, chara) in enumerate(existing_data):
-        for i in (1, 2):
-            sn_k = 'Skill{}Name'.format(i)
-            if chara[sn_k] == row[ROW_INDEX]:
-                chara[sn_k] = get_label(row['_Name'])
-                existing_data[idx] = (name, chara)
+    for i in (1, 2):
+        sn_k = 'Skill{}Name'.format(i)
+        for chara in existing_data.lookup_all(row[ROW_INDEX], field=sn_k):
+            chara[sn_k] = get_label(row['_Name'])
 
 def process_Dragon(out_file):
     results = db_query_all(
@@ -1316,10 +2505,9 @@ def process_ExAbilityData(row, existing_data):
     new_row['Name'] = get_label(row['_Name'])
     # guess the generic name by chopping off the last word, which is usually +n% or V
     new_row['GenericName'] = new_row['Name'][0:new_row['Name'].rfind(' ')]
-    new_row['Details'] = get_label(row['_Details']).format(
-        value1=row['_AbilityType1UpValue0']
-    )
-    new_row['Details'] = PERCENTAGE_REGEX.sub(r" '''\1%'''", new_row['Details'])
+    new_row['Details'] = format_label(get_label(row['_Details']), {
+        'value1': row['_AbilityType1UpValue0'],
+    }, bold_percentages=True)
     new_row['Effects'] = '' # TODO
     new_row['AbilityIconName'] = row['_AbilityIconName']
     new_row['Category'] = row['_Category']
@@ -1610,14 +2798,9 @@ def process_QuestRewardData(row, existing_data):
     QUEST_COMPLETE_COUNT = 3
     reward_template = '\n{{{{DropReward|droptype=First|itemtype={}|item={}|exact={}}}}}'
 
-    found = False
-    for index,existing_row in enumerate(existing_data):
-        if existing_row[1]['Id'] == row[ROW_INDEX]:
-            found = True
-            break
-    assert(found)
+    curr_row = existing_data.lookup(row[ROW_INDEX])
+    assert(curr_row is not None)
 
-    curr_row = existing_row[1]
     complete_type_dict = {
         '1' : (lambda x: 'Don\'t allow any of your team to fall in battle' if x == '0' else 'Allow no more than {} of your team to fall in battle'.format(x)),
         '15': (lambda x: 'Don\'t use any continues'),
@@ -1660,22 +2843,11 @@ def process_QuestRewardData(row, existing_data):
     if (quest_scoring_enemy_group_id := row['_QuestScoringEnemyGroupId']) != '0':
         curr_row['QuestScoringEnemyGroupId'] = quest_scoring_enemy_group_id
 
-    existing_data[index] = (existing_row[0], curr_row)
-
 def process_QuestBonusData(row, existing_data):
-
-    found = False
-    for index, existing_row in enumerate(existing_data):
-        if '_Gid' not in existing_row[1]:
-            found = False
-            break
-        if existing_row[1]['_Gid'] == row['_Id']:
-            found = True
-            break
-    if not found:
+    curr_row = existing_data.lookup(row['_Id'], field='_Gid')
+    if curr_row is None:
         return
 
-    curr_row = existing_row[1]
     if row['_QuestBonusType'] == '1':
         curr_row['DailyDropQuantity'] = row['_QuestBonusCount']
         curr_row['DailyDropReward'] = ''
@@ -1683,8 +2855,6 @@ def process_QuestBonusData(row, existing_data):
         curr_row['WeeklyDropQuantity'] = row['_QuestBonusCount']
         curr_row['WeeklyDropReward'] = ''
 
-    existing_data[index] = (existing_row[0], curr_row)
-
 def process_QuestMainMenu(row, existing_data):
     new_row = OrderedDict()
     new_row['Id'] = row[ROW_INDEX]
@@ -1720,10 +2890,12 @@ def process_QuestMainMenu(row, existing_data):
     if prev_quest_id != '0':
       new_row['PreviousQuest'] = get_quest_title(row['_ReleaseQuestType1'], prev_quest_id) or prev_quest_id
 
+    # Spelled out as ORs (rather than IN) so each _ReleaseQuestId index can be used
     next_quests = db_query_all(
         "SELECT _EntryQuestId1,_EntryQuestType1 FROM QuestMainMenu "
-        f"WHERE '{quest_id}' IN (_ReleaseQuestId1, _ReleaseQuestId2, _ReleaseQuestId3) "
-        "AND _EntryQuestType1 != '3'")
+        "WHERE (_ReleaseQuestId1=?1 OR _ReleaseQuestId2=?1 OR _ReleaseQuestId3=?1) "
+        "AND _EntryQuestType1 != '3' "
+        "ORDER BY rowid", (quest_id,))
     for i in range(len(next_quests)):
         next_quest_id = next_quests[i]['_EntryQuestId1']
         key = 'NextQuest' + (str(i + 1) if i > 0 else '')
@@ -1833,10 +3005,11 @@ def process_WeaponSkin(row):
 
 def process_Weapons(out_file):
     weapon_skins = db_query_all("SELECT * FROM WeaponSkin WHERE _Id!='0'")
+    weapon_bodies = db_group_by('WeaponBody', '_WeaponSkinId')
     for skin in weapon_skins:
         skin_row = process_WeaponSkin(skin)
         skin_id = skin_row['Id']
-        weapon = db_query_one(f"SELECT * FROM WeaponBody WHERE _WeaponSkinId='{skin_id}'")
+        weapon = next(iter(weapon_bodies.get(skin_id, ())), None)
         if weapon:
             weapon_row = process_WeaponBody(weapon)
             skin_row['HideDisplay'] = 1
@@ -1953,7 +3126,7 @@ def process_RaidEventReward(reader, outfile):
         outfile.write('</tabber>\n</div>')
         outfile.write(ENTRY_LINE_BREAK)
 
-def process_CombatEventLocation(reader, outfile, reward_filename):
+def process_CombatEventLocation(reader, outfile, rewards_reader):
     events = defaultdict(dict)
 
     for row in reader:
@@ -1964,14 +3137,12 @@ def process_CombatEventLocation(reader, outfile, reward_filename):
             'Rewards': [],
         }
 
-    with open(reward_filename, 'r', newline='', encoding='utf-8') as in_file:
-        rewards_reader = csv.DictReader(in_file)
-        for row in rewards_reader:
-            if row['_Id'] == '0':
-                continue
-            events[row['_EventId']][row['_LocationRewardId']]['Rewards'].append(
-                '* {{{{{}-}}}} x{:,}'.format(get_entity_item(row['_EntityType'], row['_EntityId']), int(row['_EntityQuantity']))
-            )
+    for row in rewards_reader:
+        if row['_Id'] == '0':
+            continue
+        events[row['_EventId']][row['_LocationRewardId']]['Rewards'].append(
+            '* {{{{{}-}}}} x{:,}'.format(get_entity_item(row['_EntityType'], row['_EntityId']), int(row['_EntityQuantity']))
+        )
 
     for event_id, locations in events.items():
         outfile.write('{} - {}'.format(get_label('EVENT_NAME_' + event_id), event_id))
@@ -1990,7 +3161,7 @@ def process_BattleRoyale(out_file):
         "SELECT cd._Id FROM CharaData cd "
         "LEFT JOIN BattleRoyalCharaSkin brcs ON cd._Id=brcs._BaseCharaId "
         "WHERE cd._Id!='0' AND cd._IsPlayable AND brcs._Id IS NULL "
-        "ORDER BY cd._Id")
+        "ORDER BY CAST(cd._Id as INT)")
     out_file.write(', '.join([get_chara_name(x['_Id']) for x in unavail_skins]))
 
     out_file.write('\n\n==Adventurers==\n')
@@ -1998,7 +3169,7 @@ def process_BattleRoyale(out_file):
         "SELECT bru.*,cd._BaseId,cd._VariationId,cd._WeaponType "
         "FROM BattleRoyalUnit bru JOIN CharaData cd ON cd._Id=bru._BaseCharaDataId "
         "WHERE bru._Id!='0' "
-        "ORDER BY bru._Id")
+        "ORDER BY CAST(bru._Id as INT)")
     for unit in units:
         weapon_name = WEAPON_TYPE[int(unit['_WeaponType'])]
         data = {
@@ -2027,7 +3198,7 @@ def process_BattleRoyale(out_file):
         "SELECT brcs.*,cd._BaseId,cd._VariationId,cd._WeaponType FROM BattleRoyalCharaSkin brcs "
         "JOIN CharaData cd ON brcs._BaseCharaId=cd._Id "
         "WHERE _SpecialSkillId!='0' "
-        "ORDER BY _Id")
+        "ORDER BY CAST(brcs._Id as INT)")
     for skin in special_skins:
         out_file.write(build_wikitext_row('ABRCharacter', {
             'Id': skin['_Id'],
@@ -2061,17 +3232,19 @@ def process_BattleRoyale(out_file):
     skins = db_query_all(
         "SELECT * FROM BattleRoyalCharaSkin "
         "WHERE _Id!='0' "
-        "ORDER BY _Id")
+        "ORDER BY CAST(_Id as INT)")
     for skin in skins:
         out_file.write(ENTRY_LINE_BREAK)
         out_file.write(get_chara_name(skin['_BaseCharaId']))
         out_file.write(ENTRY_LINE_BREAK)
 
-        skin['_UnlockMaterialId'] = get_label('MATERIAL_NAME_' + skin['_UnlockMaterialId'])
         for key in skin.keys():
             if key in ('_EntriesKey', '_Id', '_BaseCharaId', '_AnimController'):
                 continue
-            out_file.write(key + ': ' + skin[key] + '\n')
+            value = skin[key]
+            if key == '_UnlockMaterialId':
+                value = get_label('MATERIAL_NAME_' + value)
+            out_file.write(key + ': ' + value + '\n')
 
 def process_BattleRoyalCharaSkinPickup(row, existing_data):
     new_row = OrderedDict()
@@ -2095,7 +3268,7 @@ def process_BattleRoyalEnemy(out_file):
             "JOIN EnemyData ed ON ed._Id=ep._DataId "
             "JOIN EnemyList el ON ed._BookId=el._id "
         "WHERE bre._Id!='0' "
-        "ORDER BY bre._Id")
+        "ORDER BY CAST(bre._Id as INT)")
     for e in enemies:
         out_file.write('\n|-\n| ' + ' || '.join([
             get_label(e['_Name']),
@@ -2110,6 +3283,7 @@ def process_BattleRoyalEventCyclePointReward(out_file):
     cycles = db_query_all(
         "SELECT * FROM BattleRoyalEventCycle "
         "WHERE _Id!='0' ORDER BY _EndDate DESC")
+    cycle_rewards = db_group_by('EventCyclePointReward', '_EventCycleId', order_by='_Id')
 
     for cycle in cycles:
         out_file.write(ENTRY_LINE_BREAK)
@@ -2121,10 +3295,7 @@ def process_BattleRoyalEventCyclePointReward(out_file):
         out_file.write('! Item !! Qty !! Battle Point Req.')
 
         cycle_id = cycle['_Id']
-        rewards = db_query_all(
-            "SELECT * FROM EventCyclePointReward "
-            f"WHERE _EventCycleId='{cycle_id}' "
-            "ORDER BY _Id")
+        rewards = cycle_rewards.get(cycle_id, [])
         for r in rewards:
             out_file.write('\n|-\n| ' + ' || '.join([
                 get_entity_item(r['_RewardEntityType'], r['_RewardEntityId'], format=0),
@@ -2137,6 +3308,7 @@ def process_LoginBonusData(out_file):
     bonuses = db_query_all(
         "SELECT _Id,_LoginBonusName,_StartTime,_EndTime,_EachDayEntityType,_EachDayEntityQuantity "
         "FROM LoginBonusData WHERE _Id != '0' ORDER BY _EndTime DESC")
+    bonus_rewards = db_group_by('LoginBonusReward', '_Gid')
 
     for bonus in bonuses:
         bonus_id = bonus['_Id']
@@ -2145,10 +3317,7 @@ def process_LoginBonusData(out_file):
         start_date = datetime.strptime(bonus['_StartTime'] + ' UTC', '%Y/%m/%d %H:%M:%S %Z').strftime('%B %d, %Y %X %Z').strip()
         end_date = datetime.strptime(bonus['_EndTime'] + ' UTC', '%Y/%m/%d %H:%M:%S %Z').strftime('%B %d, %Y %X %Z').strip()
 
-        rewards = db_query_all(
-            "SELECT _Id,_Gid,_Day,_EntityType,_EntityId,_EntityQuantity "
-            f"FROM LoginBonusReward WHERE _Gid='{bonus_id}'")
-        rewards = '\n'.join(login_bonus_reward_string(r) for r in rewards)
+        rewards = '\n'.join(login_bonus_reward_string(r) for r in bonus_rewards.get(bonus_id, []))
 
         out_file.write('===' + name + '===\n')
         out_file.write('[[File:Banner ' + name + '.png|300px|right]]\n')
@@ -2172,16 +3341,16 @@ def process_ManaCircle(out_file):
         "FROM CharaData "
         "WHERE _ManaCircleName != '' "
         "GROUP BY _ManaCircleName,_PieceMaterialElementId")
-    nodes = db_query_all("SELECT * FROM MC WHERE _Id != '0' ORDER BY _Hierarchy,CAST(_No AS int)")
+    nodes = db_query_all("SELECT * FROM MC WHERE _Id != '0' ORDER BY CAST(_Hierarchy AS int),CAST(_No AS int)")
     pieces = db_query_all("SELECT * FROM ManaPieceMaterial WHERE _Id != '0'")
 
     nodes_by_mc = defaultdict(list)
     for n in nodes:
-        nodes_by_mc['MC_0' + n['_EntriesKey']].append(n)
+        nodes_by_mc['MC_0{}'.format(n['_EntriesKey'])].append(n)
 
     pieces_dict = defaultdict(lambda: defaultdict(dict))
     for p in pieces:
-        pieces_dict[p['_ElementId']][p['_ManaPieceType']][p['_Step']] = p
+        pieces_dict[p['_ElementId']][p['_ManaPieceType']][int(p['_Step'] or 0)] = p
 
     material_fields = {
         'Mana': '_NecessaryManaPoint',
@@ -2211,17 +3380,17 @@ def process_ManaCircle(out_file):
         piece_element_id = combo['_PieceMaterialElementId']
         pieces = pieces_dict.get(piece_element_id, {})
         stepCounters = defaultdict(int)
-        rarity_cost_rows = cost_rows[combo['_Rarity']]
+        rarity_cost_rows = cost_rows[int(combo['_Rarity'] or 0)]
 
         for n in nodes_by_mc[mc_id]:
             nodeType = n['_ManaPieceType']
             stepCounters[nodeType] += 1
             step = stepCounters[nodeType]
-            piece = pieces.get(nodeType, {}).get(str(step), None)
+            piece = pieces.get(nodeType, {}).get(step, None)
 
             for mat_type in material_fields:
                 quantity = n[material_fields[mat_type]]
-                if quantity > '0':
+                if int(quantity or 0) > 0:
                     rarity_cost_rows.append(build_wikitext_row('MCNodeCost', {
                         'MC': mc_id,
                         'MCElementId': piece_element_id,
@@ -2231,7 +3400,7 @@ def process_ManaCircle(out_file):
                         'MaterialQuantity': n[material_fields[mat_type]],
                     }))
             if piece:
-                if piece['_DewPoint'] > '0':
+                if int(piece['_DewPoint'] or 0) > 0:
                     rarity_cost_rows.append(build_wikitext_row('MCNodeCost', {
                         'MC': mc_id,
                         'MCElementId': piece_element_id,
@@ -2242,7 +3411,7 @@ def process_ManaCircle(out_file):
                     }))
                 for i in range(1,4):
                     matQuant = piece['_MaterialQuantity' + str(i)]
-                    if matQuant > '0':
+                    if int(matQuant or 0) > 0:
                         rarity_cost_rows.append(build_wikitext_row('MCNodeCost', {
                             'MC': mc_id,
                             'MCElementId': piece_element_id,
@@ -2259,7 +3428,7 @@ def process_ManaCircle(out_file):
         out_file.write(ENTRY_LINE_BREAK)
         out_file.write('Template:MCNodeCost/Data/{}'.format(i))
         out_file.write(ENTRY_LINE_BREAK)
-        out_file.write('\n'.join(cost_rows[str(i)]))
+        out_file.write('\n'.join(cost_rows[i]))
 
 def process_MCNodeCostUnbinds(out_file):
     chara_unique_grow_mats = db_query_all(
@@ -2280,7 +3449,7 @@ def process_MCNodeCostUnbinds(out_file):
         for floor in range(1, 6):
             for growMatNum in range(1,3):
                 quantity = u[f'_UniqueGrowMaterial{growMatNum}Num{floor}']
-                if quantity > '0':
+                if int(quantity or 0) > 0:
                     unbind_rows.append(build_wikitext_row('MCNodeCost', {
                         'MCElementId': u['_Id'],
                         'Floor': floor + 1,
@@ -2291,7 +3460,7 @@ def process_MCNodeCostUnbinds(out_file):
 
             for orbNum in range(1, 6):
                 quantity = u[f'_OrbData{orbNum}Num{floor}']
-                if quantity > '0':
+                if int(quantity or 0) > 0:
                     materialId = u[f'_OrbData{orbNum}Id{floor}']
                     if materialId in unique_grow_mats:
                         materialId = unique_grow_mats[materialId]
@@ -2310,7 +3479,7 @@ def process_QuestScoringEnemy(out_file):
         "FROM QuestScoringEnemy qse "
         "JOIN EnemyList el ON(qse._EnemyListId=el._Id) "
         "WHERE qse._Id != '0' "
-        "ORDER BY _ScoringEnemyGroupId, qse._Id")
+        "ORDER BY _ScoringEnemyGroupId, CAST(qse._Id as INT)")
     for row in rows:
         new_row = {k[1:]: v for k,v in row.items() if k not in ('_EntriesKey', '_EnemyListId')}
         new_row['Name'] = get_label(new_row['Name'])
@@ -2372,6 +3541,8 @@ def process_EndeavorSets(out_file):
     campaigns = db_query_all(
         "SELECT _Id,_CampaignName,_CampaignType,_StartDate,_EndDate "
         "FROM CampaignData WHERE _CampaignType='9' AND _Id != '0' ORDER BY _StartDate")
+    all_daily_endeavors = db_group_by('MissionDailyData', '_CampaignId', order_by='_SortId')
+    all_limited_endeavors = db_group_by('MissionPeriodData', '_CampaignId', order_by='_SortId')
 
     for c in campaigns:
         campaign_id = c['_Id']
@@ -2380,12 +3551,8 @@ def process_EndeavorSets(out_file):
         month = datetime.strptime(start_date, '%Y/%m/%d %H:%M:%S %Z').strftime(' (%b %Y)')
         name = get_label(c['_CampaignName']) + month
 
-        daily_endeavors = db_query_all(
-            "SELECT _Id,_Text,_SortId,_EntityType,_EntityId,_EntityQuantity "
-            f"FROM MissionDailyData WHERE _CampaignId='{campaign_id}' ORDER BY _SortId")
-        limited_endeavors = db_query_all(
-            "SELECT _Id,_Text,_SortId,_EntityType,_EntityId,_EntityQuantity "
-            f"FROM MissionPeriodData WHERE _CampaignId='{campaign_id}' ORDER BY _SortId")
+        daily_endeavors = all_daily_endeavors.get(campaign_id, [])
+        limited_endeavors = all_limited_endeavors.get(campaign_id, [])
 
         if len(daily_endeavors):
             daily_set = {
@@ -2414,6 +3581,9 @@ def process_EndeavorSetsEvents(out_file):
     events = db_query_all(
         "SELECT _Id,_Name,_StartDate,_EndDate FROM EventData "
         "WHERE _Id != '0' ORDER BY _StartDate")
+    all_daily_endeavors = db_group_by('MissionDailyData', '_QuestGroupId', order_by='_SortId')
+    all_limited_endeavors = db_group_by('MissionPeriodData', '_QuestGroupId', order_by='_SortId')
+    all_memory_endeavors = db_group_by('MissionMemoryEventData', '_EventId', order_by='_SortId')
 
     for e in events:
         event_id = e['_Id']
@@ -2422,15 +3592,9 @@ def process_EndeavorSetsEvents(out_file):
         month = datetime.strptime(start_date, '%Y/%m/%d %H:%M:%S %Z').strftime('%B %Y')
         name = get_label(e['_Name'])
 
-        daily_endeavors = db_query_all(
-            "SELECT _Id,_Text,_SortId,_EntityType,_EntityId,_EntityQuantity "
-            f"FROM MissionDailyData WHERE _QuestGroupId='{event_id}' ORDER BY _SortId")
-        limited_endeavors = db_query_all(
-            "SELECT _Id,_Text,_SortId,_EntityType,_EntityId,_EntityQuantity "
-            f"FROM MissionPeriodData WHERE _QuestGroupId='{event_id}' ORDER BY _SortId")
-        memory_endeavors = db_query_all(
-            "SELECT _Id,_Text,_SortId,_EntityType,_EntityId,_EntityQuantity "
-            f"FROM MissionMemoryEventData WHERE _EventId='{event_id}' ORDER BY _SortId")
+        daily_endeavors = all_daily_endeavors.get(event_id, [])
+        limited_endeavors = all_limited_endeavors.get(event_id, [])
+        memory_endeavors = all_memory_endeavors.get(event_id, [])
 
         if len(daily_endeavors):
             daily_set = {
@@ -2542,7 +3706,7 @@ def process_RankingGroupData(out_file):
         "WHERE _Id!='0' ORDER BY _RankingEndDate DESC")
     ranking_tier_rewards = db_query_all(
         "SELECT * FROM RankingTierReward "
-        "WHERE _Id!='0' ORDER BY _Id")
+        "WHERE _Id!='0' ORDER BY CAST(_Id as INT)")
     reward_lists = defaultdict(lambda: defaultdict(list))
     for reward in ranking_tier_rewards:
         reward_lists[reward['_GroupId']][reward['_QuestId']].append(reward)
@@ -2617,7 +3781,60 @@ def process_KeyValues(row, existing_data):
             new_row[k[1:]] = v
     existing_data.append((None, new_row))
 
+def render_GenericTemplate(template, columns, rows):
+    """process_GenericTemplate and row_as_wikitext over whole result tuples at once.
+
+    The key renaming, column filter and ordering are worked out once into a format
+    string, so each row is a single format call.
+    """
+    names = {}
+    for idx, column in enumerate(columns):
+        if 'EntriesKey' in column:
+            continue
+        if column[1:] in names:
+            return None
+        names[column[1:]] = idx
+    key_source = ORDERING_DATA[template] if template in ORDERING_DATA else names
+    def escape(text):
+        return text.replace('{', '{{').replace('}', '}}')
+    row_format = '{{{{' + escape(template) + '|' + '|'.join(
+        ['{}={{{}}}'.format(escape(k), names[k]) for k in key_source if k in names]) + '}}}}\n'
+    return ''.join([row_format.format(*values) for values in rows])
+
+def render_KeyValues(template, columns, rows):
+    """process_KeyValues and row_as_kv_pairs over whole result tuples at once.
+
+    Each column is rendered to its lines in one pass, None standing in for the
+    values that are left out, and the rows are joined from those.
+    """
+    names = set()
+    rendered = []
+    for column, values in zip(columns, zip(*rows) if rows else [()] * len(columns)):
+        values = [v if v is None or type(v) is str else str(v) for v in values]
+        if column == ROW_INDEX:
+            keys = ('Id',)
+            rendered.append(['Id: {}'.format(v) for v in values])
+        elif 'Text' in column:
+            keys = (column[1:], column[1:]+'Label')
+            labels = [get_label(v) for v in values]
+            rendered.append([None if label == '' else '{}: {}\n\t{}Label: {}'.format(keys[0], v, keys[0], label)
+                             for v, label in zip(values, labels)])
+        else:
+            keys = (column[1:],)
+            prefix = keys[0] + ': '
+            rendered.append([None if v == '0' or v == '' else prefix + str(v) for v in values])
+        if names.intersection(keys):
+            return None
+        names.update(keys)
+    return ''.join(['\n\t'.join(filter(None, lines)) + '\n' for lines in zip(*rendered)])
+
 def build_wikitext_row(template_name, row, delim='|'):
+    RUN_COUNTERS['entities'] += 1
+    if ENTITY_SNAPSHOT is not None:
+        ENTITY_SNAPSHOT.add(template_name, row)
+    return wikitext_row(template_name, row, delim)
+
+def wikitext_row(template_name, row, delim='|'):
     row_str = '{{' + template_name + delim
     if template_name in ORDERING_DATA:
         key_source = ORDERING_DATA[template_name]
@@ -2634,10 +3851,10 @@ def row_as_wikitext(row, template_name, display_name = None):
     if display_name is not None:
         text += display_name
         text += ENTRY_LINE_BREAK
-        text += build_wikitext_row(template_name, row, delim='\n|')
+        text += wikitext_row(template_name, row, delim='\n|')
         text += ENTRY_LINE_BREAK
     else:
-        text += build_wikitext_row(template_name, row)
+        text += wikitext_row(template_name, row)
         text += '\n'
     return text
 
@@ -2656,23 +3873,216 @@ def copy_without_entriesKey(new_row, row):
             continue
         new_row[k[1:]] = v
 
-def db_query_one(query):
-    db.execute(query)
-    return db.fetchone()
-
-def db_query_all(query):
-    db.execute(query)
-    return db.fetchall()
+def track_tables(*tables):
+    if TABLES_READ is not None:
+        TABLES_READ.update(tables)
+
+@functools.lru_cache(maxsize=None)
+def query_tables(query):
+    return tuple(TABLE_NAME_REGEX.findall(query))
+
+class TableIndex(dict):
+    """A db_as_index of a table kept in a global, loaded the first time it is looked up.
+
+    Reports its table as read on every lookup, for incremental runs.
+    """
+    def __init__(self, table, index='_Id', value_key=None):
+        super().__init__()
+        self.table = table
+        self.index = index
+        self.value_key = value_key
+        self.loaded = False
+
+    def load(self):
+        self.update(db_as_index(self.table, index=self.index, value_key=self.value_key))
+        self.loaded = True
+
+    def __getitem__(self, key):
+        track_tables(self.table)
+        if not self.loaded:
+            self.load()
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        track_tables(self.table)
+        if not self.loaded:
+            self.load()
+        return dict.get(self, key, default)
+
+def db_execute(cursor, query, params=()):
+    if TABLES_READ is not None:
+        TABLES_READ.update(query_tables(query))
+    # Monos are loaded lazily, so the first query against a table is what pulls it in
+    while True:
+        try:
+            return cursor.execute(query, params)
+        except sqlite3.OperationalError as e:
+            if not mono_db.load_missing(e):
+                raise
+
+def db_query_one(query, params=()):
+    start = time.perf_counter()
+    db_execute(db, query, params)
+    result = db.fetchone()
+    RUN_COUNTERS['rows'] += result is not None
+    stats = QUERY_STATS[query]
+    stats[0] += 1
+    stats[1] += time.perf_counter() - start
+    return result
+
+def db_query_all(query, params=()):
+    start = time.perf_counter()
+    db_execute(db, query, params)
+    result = db.fetchall()
+    RUN_COUNTERS['rows'] += len(result)
+    stats = QUERY_STATS[query]
+    stats[0] += 1
+    stats[1] += time.perf_counter() - start
+    return result
+
+def db_iter_table(table_name):
+    """Streams the rows of a table in stored order, skipping the _Id 0 placeholder row.
+
+    Uses a cursor of its own, so the caller is free to run other queries while iterating.
+    """
+    start = time.perf_counter()
+    query = f"SELECT * FROM {table_name} WHERE {ROW_INDEX} != '0' ORDER BY rowid"
+    cursor = db_execute(db.connection.cursor(), query)
+    stats = QUERY_STATS[query]
+    stats[0] += 1
+    stats[1] += time.perf_counter() - start
+    return counted_rows(cursor)
+
+def counted_rows(cursor):
+    count = 0
+    try:
+        for row in cursor:
+            count += 1
+            yield row
+    finally:
+        RUN_COUNTERS['rows'] += count
+
+def db_query_in(query, keys, params=()):
+    """Runs a query whose {} is an IN list over many keys, in as few round trips as possible.
+
+    e.g. db_query_in("SELECT * FROM CharaData WHERE _Id IN ({})", chara_ids)
+    Any params are bound ahead of the keys. Duplicate keys are only looked up once.
+    """
+    keys = list(dict.fromkeys(keys))
+    results = []
+    for start in range(0, len(keys), IN_BATCH_SIZE):
+        batch = keys[start:start+IN_BATCH_SIZE]
+        results.extend(db_query_all(
+            query.format(','.join('?' * len(batch))), tuple(params) + tuple(batch)))
+    return results
+
+def db_group_by(table, key, order_by=None):
+    """Loads a whole table once, as {key value: [rows]}.
+
+    Lets processors look up the child rows of every parent from memory instead
+    of querying once per parent. Rows in each group are in order_by order, ties
+    (or everything, without order_by) in rowid order. Groupings are cached for the rest of the run.
+    """
+    cache_key = (table, key, order_by)
+    track_tables(table)
+    if cache_key not in PREFETCH_CACHE:
+        groups = defaultdict(list)
+        order = f'{order_by}, rowid' if order_by else 'rowid'
+        for row in db_query_all(f"SELECT * FROM {table} ORDER BY {order}"):
+            groups[row[key]].append(row)
+        PREFETCH_CACHE[cache_key] = groups
+    return PREFETCH_CACHE[cache_key]
+
+def print_query_stats(limit=20):
+    print('{:>8} {:>10} {:>9}  {}'.format('Calls', 'Total ms', 'us/call', 'Query'))
+    for query, (calls, seconds) in sorted(QUERY_STATS.items(), key=lambda item: -item[1][1])[:limit]:
+        print('{:>8} {:>10.1f} {:>9.1f}  {}'.format(
+            calls, seconds * 1000, seconds * 1e6 / calls, ' '.join(query.split())[:120]))
+
+class Row(Mapping):
+    """Read-only result row: the value tuple sqlite returns, plus a column -> index
+    map shared by every row of the query, instead of a dict per row.
+
+    Values of typed columns are handed back as the strings they were read from,
+    same as the csv readers, converted only when accessed.
+    """
+    __slots__ = ('_columns', '_values')
+
+    def __init__(self, columns, values):
+        self._columns = columns
+        self._values = values
+
+    def __getitem__(self, key):
+        value = self._values[self._columns[key]]
+        return value if value is None or type(value) is str else str(value)
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, dict(self))
+
+    def __reduce__(self):
+        return (type(self), (self._columns, self._values))
+
+class TypedRow(Row):
+    """Row that hands back values with their column's native type."""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return self._values[self._columns[key]]
+
+# cursor.description is the same tuple for every row of a query, so the column map is only
+# rebuilt when the query changes
+last_description = None
+last_columns = None
+
+def column_map(description):
+    global last_description, last_columns
+    if description is not last_description:
+        last_columns = {col[0]: idx for idx, col in enumerate(description)}
+        last_description = description
+    return last_columns
 
 def row_factory(cursor, row):
-    return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+    return Row(column_map(cursor.description), row)
+
+def typed_row_factory(cursor, row):
+    return TypedRow(column_map(cursor.description), row)
+
+# Row-independent DataParser functions, whose tables DataParser.process_sharded can split up
+SHARDABLE_PROCESSING = {
+    process_GenericTemplate,
+    process_GenericTemplateWithEntriesKey,
+    process_KeyValues,
+    process_Material,
+    process_SkillData,
+}
+
+# Row-independent (DataParser function, formatter) pairs that render_rows renders a column at a time
+COLUMNAR_PROCESSING = {
+    (process_GenericTemplate, row_as_wikitext): render_GenericTemplate,
+    (process_KeyValues, row_as_kv_pairs): render_KeyValues,
+}
+
+# DataParser functions that go back to rows appended before them, so a streamed DataParser has to keep its rows
+BUFFERED_PROCESSING = {
+    process_QuestRewardData,
+    process_QuestBonusData,
+    process_SkillDataNames,
+}
 
 DATA_PARSER_PROCESSING = {
     'AbilityLimitedGroup': ('AbilityLimitedGroup', row_as_wikitext, process_AbilityLimitedGroup),
     'CharaData': ('Adventurer', row_as_wikitext,
         [('CharaModeData', process_CharaModeData),
          ('CharaData', process_CharaData)]),
-    # Must come after CharaData processing
     'AbilityData': ('Ability', row_as_wikitext,
         [('AbilityShiftGroup', process_AbilityShiftGroup),
          ('AbilityData', process_AbilityData)]),
@@ -2783,8 +4193,415 @@ KV_PROCESSING = {
     'QuestData': ('QuestData', row_as_kv_pairs, process_KeyValues),
 }
 
-def process(input_dir='./', output_dir='./output-data', ordering_data_path=None, delete_old=False):
-    global db, in_dir, ORDERING_DATA, SKILL_DATA_NAMES, EPITHET_RANKS
+# Processors that read global state another processor fills in, by the name they are
+# reported under ('kv/' + name for KV_PROCESSING). process_CharaData fills CHAIN_COAB_SET.
+PROCESSOR_DEPENDENCIES = {
+    'AbilityData': ('CharaData',),
+    'ChainCoAbility': ('CharaData',),
+}
+
+def run_data_parser(data_name, process_params, out_dir, prefix=''):
+    template, formatter, process_info = process_params
+    parser = DataParser(data_name, template, formatter, process_info)
+    if STREAM_EMIT:
+        parser.stream(out_dir)
+    else:
+        parser.process()
+        parser.emit(out_dir)
+    print('Saved {}{}{}'.format(prefix, data_name, EXT))
+
+def run_database_parser(data_name, process_params, out_dir):
+    parser = DatabaseBasedParser(data_name, process_params)
+    parser.process(out_dir)
+    print('Saved {}{}'.format(data_name, EXT))
+
+def run_custom_parser(data_name, process_params, out_dir):
+    parser = CustomDataParser(data_name, process_params)
+    parser.process(out_dir)
+    print('Saved {}{}'.format(data_name, EXT))
+
+def processor_runs(out_dir):
+    """Every processor by the name it is reported under, with a function running it, in serial order."""
+    kv_out = out_dir+'/kv/'
+    runs = OrderedDict()
+    for data_name, process_params in DATA_PARSER_PROCESSING.items():
+        runs[data_name] = functools.partial(run_data_parser, data_name, process_params, out_dir)
+    for data_name, process_params in DATABASE_BASED_PROCESSING.items():
+        runs[data_name] = functools.partial(run_database_parser, data_name, process_params, out_dir)
+    for data_name, process_params in NON_TEMPLATE_PROCESSING.items():
+        runs[data_name] = functools.partial(run_custom_parser, data_name, process_params, out_dir)
+    for data_name, process_params in KV_PROCESSING.items():
+        runs['kv/' + data_name] = functools.partial(run_data_parser, data_name, process_params, kv_out, 'kv/')
+    return runs
+
+def run_processor(name, run, track=False):
+    """Runs one processor under its name, recording it in PROCESSOR_REPORT. With track, returns the tables it read."""
+    global CURRENT_PROCESSOR, TABLES_READ, TEXT_LABEL_DICT
+    CURRENT_PROCESSOR = name
+    counters = RUN_COUNTERS.copy()
+    queries = sum(calls for calls, _ in QUERY_STATS.values())
+    traced = None
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+        traced = tracemalloc.get_traced_memory()[0]
+    start, start_cpu = time.perf_counter(), time.process_time()
+    if not track:
+        run()
+        tables = None
+    else:
+        labels = TEXT_LABEL_DICT
+        # A fresh view of the label stores, so the label tables used are reported again for this processor
+        TABLES_READ, TEXT_LABEL_DICT = set(), labels.view()
+        try:
+            run()
+            tables = TABLES_READ
+        finally:
+            TABLES_READ, TEXT_LABEL_DICT = None, labels
+    if ENTITY_SNAPSHOT is not None:
+        ENTITY_SNAPSHOT.flush()
+    PROCESSOR_REPORT[name] = {
+        'wall_seconds': round(time.perf_counter() - start, 6),
+        'cpu_seconds': round(time.process_time() - start_cpu, 6),
+        'rows_in': RUN_COUNTERS['rows'] - counters['rows'],
+        'entities_out': RUN_COUNTERS['entities'] - counters['entities'],
+        'bytes_out': RUN_COUNTERS['bytes'] - counters['bytes'],
+        'queries': sum(calls for calls, _ in QUERY_STATS.values()) - queries,
+        # Above what was allocated when the processor started
+        'peak_bytes': tracemalloc.get_traced_memory()[1] - traced if traced is not None else None,
+    }
+    return tables
+
+def run_forked(name, run, conn, profiler, track):
+    """Runs one processor in a forked process and sends its stats back to the scheduler."""
+    reconnect_db()
+    QUERY_STATS.clear()
+    for cache in RESOLVER_CACHES.values():
+        cache.reset_stats()
+    if profiler:
+        profiler.stats.clear()
+    tables = run_processor(name, run, track)
+    conn.send((dict(QUERY_STATS), resolver_stats(), profiler.stats if profiler else None, tables, PROCESSOR_REPORT[name]))
+    conn.close()
+
+def run_scheduled(runs, workers, profiler=None, track=False):
+    """Runs processors concurrently, each in a forked process, respecting PROCESSOR_DEPENDENCIES.
+
+    Every fork inherits the loaded database and label stores as a read-only
+    snapshot. A processor others depend on runs in this process instead, so
+    that the global state it fills in is inherited by the forks started after
+    it. Each processor writes its own output files, so the output is the same
+    as a serial run's. With track, returns the tables each processor read.
+    """
+    global CURRENT_PROCESSOR
+    for name, dependencies in PROCESSOR_DEPENDENCIES.items():
+        for dependency in dependencies:
+            if name in runs and dependency not in runs:
+                raise ValueError('{} depends on unknown processor {}'.format(name, dependency))
+    providers = {dependency for name, dependencies in PROCESSOR_DEPENDENCIES.items()
+                 if name in runs for dependency in dependencies}
+    context = multiprocessing.get_context('fork')
+    pending = OrderedDict(runs)
+    done = set()
+    tables_read = {}
+    running = {}
+    try:
+        while pending or running:
+            ready = [name for name in pending
+                     if all(dependency in done for dependency in PROCESSOR_DEPENDENCIES.get(name, ()))]
+            if not ready and not running:
+                raise ValueError('Processor dependencies form a cycle: {}'.format(', '.join(pending)))
+            # Start providers as soon as possible, and only once nothing is running, as they block this process
+            provider = next((name for name in ready if name in providers), None)
+            if provider and not running:
+                tables_read[provider] = run_processor(provider, pending.pop(provider), track)
+                done.add(provider)
+                continue
+            for name in ready:
+                if len(running) >= workers:
+                    break
+                if name in providers:
+                    continue
+                conn, child_conn = context.Pipe(duplex=False)
+                child = context.Process(target=run_forked, args=(name, pending.pop(name), child_conn, profiler, track))
+                child.start()
+                child_conn.close()
+                running[child.sentinel] = (name, child, conn)
+            if not running:
+                continue
+            for sentinel in multiprocessing.connection.wait(list(running)):
+                name, child, conn = running.pop(sentinel)
+                try:
+                    query_stats, resolver_counts, label_stats, tables_read[name], PROCESSOR_REPORT[name] = conn.recv()
+                except EOFError:
+                    query_stats = None
+                conn.close()
+                child.join()
+                if child.exitcode or query_stats is None:
+                    raise RuntimeError('Processor {} failed with exit code {}'.format(name, child.exitcode))
+                for query, (calls, seconds) in query_stats.items():
+                    stats = QUERY_STATS[query]
+                    stats[0] += calls
+                    stats[1] += seconds
+                merge_resolver_stats(resolver_counts)
+                if profiler:
+                    profiler.merge(label_stats)
+                done.add(name)
+    finally:
+        # Only left running when a processor failed, so nothing else may keep writing output
+        for name, child, conn in running.values():
+            child.terminate()
+            child.join()
+            conn.close()
+    CURRENT_PROCESSOR = None
+    return tables_read
+
+def print_run_report(limit=RUN_REPORT_TOP_N):
+    print('{:<36} {:>9} {:>9} {:>8} {:>8} {:>10} {:>7} {:>10}'.format(
+        'Processor', 'Wall ms', 'CPU ms', 'Rows', 'Entities', 'Bytes', 'Queries', 'Peak KiB'))
+    for name, entry in sorted(PROCESSOR_REPORT.items(), key=lambda item: -item[1]['wall_seconds'])[:limit]:
+        peak = entry['peak_bytes']
+        print('{:<36} {:>9.1f} {:>9.1f} {:>8} {:>8} {:>10} {:>7} {:>10}'.format(
+            name, entry['wall_seconds'] * 1000, entry['cpu_seconds'] * 1000, entry['rows_in'],
+            entry['entities_out'], entry['bytes_out'], entry['queries'],
+            '-' if peak is None else '{:.1f}'.format(peak / 1024)))
+    print('{:<36} {:>9.1f} {:>9.1f} {:>8} {:>8} {:>10} {:>7}'.format(
+        'Total ({} processors)'.format(len(PROCESSOR_REPORT)),
+        *(sum(entry[field] for entry in PROCESSOR_REPORT.values()) * scale for field, scale in
+          (('wall_seconds', 1000), ('cpu_seconds', 1000), ('rows_in', 1), ('entities_out', 1),
+           ('bytes_out', 1), ('queries', 1)))))
+
+def write_run_report(path, run_info):
+    """Writes run_info and the PROCESSOR_REPORT entry of every processor run, as JSON."""
+    with open(path, 'w', encoding='utf-8') as out_file:
+        json.dump(dict(run_info, processors=PROCESSOR_REPORT), out_file, indent=2)
+
+def manifest_fingerprint():
+    """What every output depends on besides its tables: this script and the ordering data."""
+    ordering = json.dumps(ORDERING_DATA, sort_keys=True).encode('utf-8')
+    return {'code': file_hash(os.path.abspath(__file__)), 'ordering': hashlib.sha1(ordering).hexdigest()}
+
+def read_manifest(out_dir, fingerprint):
+    """Tables and their hashes per processor, as recorded by the last incremental run into out_dir.
+
+    Empty when there is no usable manifest, or it was made with other code or ordering data.
+    """
+    try:
+        with open(out_dir + INCREMENTAL_MANIFEST, encoding='utf-8') as in_file:
+            manifest = json.load(in_file)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION or manifest.get('fingerprint') != fingerprint:
+        return {}
+    return manifest['processors']
+
+def write_manifest(out_dir, fingerprint, processors):
+    tmp_path = out_dir + INCREMENTAL_MANIFEST + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as out_file:
+        json.dump({'version': MANIFEST_VERSION, 'fingerprint': fingerprint, 'processors': processors},
+                  out_file, indent=1, sort_keys=True)
+    os.replace(tmp_path, out_dir + INCREMENTAL_MANIFEST)
+
+def table_hashes():
+    """Content hash of a table by name, None for tables not in the dump; each file is hashed at most once."""
+    hashes = {}
+
+    def table_hash(table_name):
+        try:
+            return hashes[table_name]
+        except KeyError:
+            pass
+        if table_name in mono_db.meta:
+            content_hash = mono_db.meta[table_name]['_Hash']
+        elif table_name in mono_db.sources:
+            content_hash = file_hash(mono_db.sources[table_name])
+        else:
+            content_hash = None
+        hashes[table_name] = content_hash
+        return content_hash
+    return table_hash
+
+def select_changed(runs, processors, out_dir, table_hash):
+    """The runs whose output is missing, or was made from tables that have changed since.
+
+    Along with everything that depends on those, and whatever they in turn
+    depend on, so that the global state they read is filled in first.
+    """
+    changed = set()
+    for name in runs:
+        recorded = processors.get(name)
+        if (recorded is None or not os.path.exists(out_dir + name + EXT)
+                or any(table_hash(table) != content_hash for table, content_hash in recorded.items())):
+            changed.add(name)
+    grew = True
+    while grew:
+        grew = False
+        for name, dependencies in PROCESSOR_DEPENDENCIES.items():
+            if name in runs and name not in changed and changed.intersection(dependencies):
+                changed.add(name)
+                grew = True
+    return with_dependencies(runs, changed)
+
+def with_dependencies(runs, names):
+    """The runs named, and every run they depend on through PROCESSOR_DEPENDENCIES, in run order."""
+    selected = set(names)
+    stack = list(names)
+    while stack:
+        for dependency in PROCESSOR_DEPENDENCIES.get(stack.pop(), ()):
+            if dependency not in selected:
+                selected.add(dependency)
+                stack.append(dependency)
+    return OrderedDict((name, run) for name, run in runs.items() if name in selected)
+
+def check_processors(runs, only=None, skip=None):
+    """Raises ValueError if only or skip name a processor that is not in runs."""
+    unknown = [name for name in list(only or ()) + list(skip or ()) if name not in runs]
+    if unknown:
+        raise ValueError('Unknown processors: {}'.format(', '.join(unknown)))
+
+def select_processors(runs, only=None, skip=None):
+    """The runs named in only (all of them by default) except those in skip, with whatever they depend on."""
+    check_processors(runs, only, skip)
+    names = set(only) if only else set(runs)
+    names.difference_update(skip or ())
+    selected = with_dependencies(runs, names)
+    needed = [name for name in selected if name not in names]
+    if needed:
+        print('Also running {}, needed by the selected processors'.format(', '.join(needed)))
+    return selected
+
+class EntitySnapshot:
+    """The entities a run emits, kept in an SQLite file as one table per version of the data.
+
+    An entity is a row handed to DataParser.emit or build_wikitext_row, keyed
+    by processor, template and its Id (or display name), and by the hash of its
+    fields when it has neither, so that adding or removing one such entity
+    leaves the keys of the others alone. Keys that repeat are told apart by an
+    occurrence count of their own. Entities are buffered per processor and
+    written out by flush, so only one processor's are held in memory.
+    """
+    def __init__(self, path, table):
+        self.path = path
+        self.table = table
+        self.pid = None
+        self.pending = []
+        self.occurrences = Counter()
+        self.connection().execute(
+            f'CREATE TABLE IF NOT EXISTS {table} '
+            '(_Processor TEXT, _Template TEXT, _Keyed INTEGER, _Key TEXT, _Occurrence INTEGER, _Hash TEXT, _Fields TEXT, '
+            'PRIMARY KEY (_Processor, _Template, _Keyed, _Key, _Occurrence))')
+
+    def connection(self):
+        # Forked processors each write through a connection of their own
+        if self.pid != os.getpid():
+            self.con = sqlite3.connect(self.path, timeout=SNAPSHOT_TIMEOUT)
+            self.pid = os.getpid()
+        return self.con
+
+    def add(self, template_name, row, display_name=None):
+        if isinstance(row, Mapping):
+            key = row.get('Id') or row.get(ROW_INDEX) or display_name
+            fields = {str(k): str(v) for k, v in row.items()}
+        else:
+            key = display_name
+            fields = {str(idx): str(v) for idx, v in enumerate(row)}
+        text = json.dumps(fields, ensure_ascii=False)
+        content_hash = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        keyed = int(bool(key))
+        key = str(key) if keyed else content_hash
+        identity = (CURRENT_PROCESSOR, template_name, keyed, key)
+        self.occurrences[identity] += 1
+        self.pending.append((CURRENT_PROCESSOR, template_name, keyed, key, self.occurrences[identity],
+                             content_hash, text))
+
+    def flush(self):
+        con = self.connection()
+        con.executemany(f'INSERT INTO {self.table} VALUES (?,?,?,?,?,?,?)', self.pending)
+        con.commit()
+        self.pending = []
+        self.occurrences.clear()
+
+def field_changes(old_fields, new_fields):
+    """(field, old value, new value) for every field that differs, None standing in for a missing field."""
+    old_fields = json.loads(old_fields)
+    new_fields = json.loads(new_fields)
+    changes = [(field, old_fields.get(field), value) for field, value in new_fields.items()
+               if old_fields.get(field) != value]
+    changes.extend((field, value, None) for field, value in old_fields.items() if field not in new_fields)
+    return changes
+
+def changelog_key(keyed, key, occurrence):
+    key = key if keyed else '(no id, {})'.format(key[:12])
+    return key if occurrence == 1 else '{} ({})'.format(key, occurrence)
+
+def changelog_value(value):
+    return '(none)' if value is None else value.replace('\n', '\\n')
+
+def write_changelog(snapshot_path, out_dir, old_table='old', new_table='new'):
+    """Writes out_dir/<processor>.txt listing the entities each processor added, removed and changed.
+
+    Processors whose entities are all the same are left out. Reads the
+    snapshot one processor and section at a time, so the size of the dumps
+    only matters to the snapshot file.
+    """
+    con = sqlite3.connect(snapshot_path)
+    processors = [row[0] for row in con.execute(
+        f'SELECT _Processor FROM {old_table} UNION SELECT _Processor FROM {new_table} ORDER BY 1')]
+    join = ('{0}._Processor={1}._Processor AND {0}._Template={1}._Template AND {0}._Keyed={1}._Keyed '
+            'AND {0}._Key={1}._Key AND {0}._Occurrence={1}._Occurrence')
+    sections = (
+        ('Added', f'SELECT n._Template, n._Keyed, n._Key, n._Occurrence FROM {new_table} n LEFT JOIN {old_table} o ON {join.format("o", "n")} '
+                  'WHERE n._Processor=? AND o._Key IS NULL ORDER BY n.rowid'),
+        ('Removed', f'SELECT o._Template, o._Keyed, o._Key, o._Occurrence FROM {old_table} o LEFT JOIN {new_table} n ON {join.format("n", "o")} '
+                    'WHERE o._Processor=? AND n._Key IS NULL ORDER BY o.rowid'),
+        ('Changed', f'SELECT n._Template, n._Keyed, n._Key, n._Occurrence, o._Fields, n._Fields FROM {new_table} n JOIN {old_table} o ON {join.format("o", "n")} '
+                    'WHERE n._Processor=? AND o._Hash!=n._Hash ORDER BY n.rowid'),
+    )
+    print('{:<36} {:>8} {:>8} {:>8}'.format('Changelog', 'Added', 'Removed', 'Changed'))
+    for processor in processors:
+        counts = []
+        out_file = None
+        for title, query in sections:
+            count = 0
+            for entity in con.execute(query, (processor,)):
+                if out_file is None:
+                    path = out_dir + processor + EXT
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    out_file = open(path, 'w', newline='', encoding='utf-8')
+                if not count:
+                    out_file.write('== {} ==\n'.format(title))
+                count += 1
+                out_file.write('{} {}\n'.format(entity[0], changelog_key(*entity[1:4])))
+                for field, old_value, new_value in field_changes(*entity[4:]) if len(entity) > 4 else ():
+                    out_file.write('\t{}: {} -> {}\n'.format(
+                        field, changelog_value(old_value), changelog_value(new_value)))
+            counts.append(count)
+        if out_file is not None:
+            out_file.close()
+            print('{:<36} {:>8} {:>8} {:>8}'.format(processor, *counts))
+    con.close()
+
+def process_changelog(old_input_dir, input_dir='./', output_dir='./output-data', old_db_path=None, db_path=None, **kwargs):
+    """Processes two dumps and writes what changed between their entities to output_dir/changelog/.
+
+    The old dump's output is only kept for the length of the run, the new
+    one's goes to output_dir as usual. Either dump may come with a persisted
+    database, as db_path does for process.
+    """
+    global ENTITY_SNAPSHOT
+    out_dir = output_dir if output_dir[-1] == '/' else output_dir+'/'
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        snapshot_path = os.path.join(tmp_dir, 'entities.db')
+        try:
+            ENTITY_SNAPSHOT = EntitySnapshot(snapshot_path, 'old')
+            process(input_dir=old_input_dir, output_dir=os.path.join(tmp_dir, 'old'), db_path=old_db_path, **kwargs)
+            ENTITY_SNAPSHOT = EntitySnapshot(snapshot_path, 'new')
+            process(input_dir=input_dir, output_dir=output_dir, db_path=db_path, **kwargs)
+        finally:
+            ENTITY_SNAPSHOT = None
+        write_changelog(snapshot_path, out_dir + 'changelog/')
+
+def process(input_dir='./', output_dir='./output-data', ordering_data_path=None, delete_old=False, db_path=None, ingest_workers=0, workers=1, incremental=False, only=None, skip=None, query_stats=False, label_profile=None, run_report=None, trace_memory=False, shard_workers=0, stream=False, entity_catalog=None):
+    global mono_db, db, in_dir, TEXT_LABEL_DICT, CURRENT_PROCESSOR, ORDERING_DATA, SKILL_DATA_NAMES, EPITHET_RANKS, SHARD_WORKERS, STREAM_EMIT, ENTITY_CATALOG
     if delete_old:
         if os.path.exists(output_dir):
             try:
@@ -2801,67 +4618,106 @@ def process(input_dir='./', output_dir='./output-data', ordering_data_path=None,
     in_dir = input_dir if input_dir[-1] == '/' else input_dir+'/'
     out_dir = output_dir if output_dir[-1] == '/' else output_dir+'/'
 
-    # Set up in-memory sql database for all monos
-    con = sqlite3.connect(':memory:')
-    con.row_factory = row_factory
-    db = con.cursor()
-
-    for mono in glob.glob(f'{in_dir}*{EXT}'):
-        with open(mono, encoding='utf-8', newline='') as file:
-            table_name = os.path.basename(mono).replace(EXT, '')
-            dialect = 'excel-tab' if 'TextLabel' in table_name else 'excel'
-            reader = csv.reader(file, dialect=dialect)
-            columns = next(reader)
-            rows = [tuple(row) for row in reader]
-            placeholder = ','.join(["?" for i in columns])
-
-            db.execute(f'CREATE TABLE {table_name} ({",".join(columns)})')
-            try:
-                db.executemany(f'INSERT INTO {table_name} VALUES ({placeholder})', rows)
-            except:
-                print('Error in input csv: {}'.format(table_name))
-                traceback.print_exc()
-    con.commit()
-
-    TEXT_LABEL_DICT['en'] = csv_as_index(in_dir+TEXT_LABEL+EXT, index='_Id', value_key='_Text', tabs=True)
-    try:
-        TEXT_LABEL_DICT['jp'] = csv_as_index(in_dir+TEXT_LABEL_JP+EXT, index='_Id', value_key='_Text', tabs=True)
-        TEXT_LABEL_DICT['sc'] = csv_as_index(in_dir+TEXT_LABEL_SC+EXT, index='_Id', value_key='_Text', tabs=True)
-        TEXT_LABEL_DICT['tc'] = csv_as_index(in_dir+TEXT_LABEL_TC+EXT, index='_Id', value_key='_Text', tabs=True)
-    except:
-        pass
-    SKILL_DATA_NAMES = csv_as_index(in_dir+SKILL_DATA_NAME+EXT, index='_Id', value_key='_Name')
-    EPITHET_RANKS = csv_as_index(in_dir+EPITHET_DATA_NAME+EXT, index='_Id', value_key='_Rarity')
+    if not FORK_AVAILABLE and (workers > 1 or shard_workers > 1):
+        print('Processes cannot be forked on this platform, running serially')
+        workers = 1
+        shard_workers = 0
+
+    run_start = time.perf_counter()
+    run_info = {'started': datetime.now().isoformat(timespec='seconds'), 'input_dir': in_dir, 'workers': workers}
+    RUN_COUNTERS.clear()
+    PROCESSOR_REPORT.clear()
+    if trace_memory:
+        tracemalloc.start()
+
+    profiler = None
+    if label_profile:
+        profiler = LabelProfiler()
+        profiler.install()
+    # Label lookups in shards would go uncounted by the profiler
+    SHARD_WORKERS = 0 if profiler else shard_workers
+    STREAM_EMIT = stream
+    CURRENT_PROCESSOR = '(setup)'
+
+    # Set up the sql database for all monos, reusing unchanged tables if persisted
+    PREFETCH_CACHE.clear()
+    CHAIN_COAB_SET.clear()
+    clear_resolver_caches()
+    ENTITY_CATALOG = EntityCatalog()
+    mono_db = MonoDatabase(in_dir, db_path)
+    mono_db.sync()
+    if ingest_workers:
+        mono_db.load_parallel(ingest_workers, skip=TEXT_LABEL_TABLES)
+    db = mono_db.cursor
+
+    label_sources = {'en': mono_db.sources[TEXT_LABEL]}
+    for lang, table in (('jp', TEXT_LABEL_JP), ('sc', TEXT_LABEL_SC), ('tc', TEXT_LABEL_TC)):
+        if not mono_db.has_table(table):
+            break
+        label_sources[lang] = mono_db.sources[table]
+    TEXT_LABEL_DICT = TextLabels(label_sources, label_dir=db_path + '-labels' if db_path else None)
+    # Only loaded if a processor that is run looks them up
+    SKILL_DATA_NAMES = TableIndex(SKILL_DATA_NAME, value_key='_Name')
+    EPITHET_RANKS = TableIndex(EPITHET_DATA_NAME, value_key='_Rarity')
     for item_type in ITEM_NAMES:
-        ITEM_NAMES[item_type] = csv_as_index(in_dir+item_type+EXT, index='_Id', value_key='_Name')
+        ITEM_NAMES[item_type] = TableIndex(item_type, value_key='_Name')
     # find_fmt_params(in_dir, out_dir)
 
-    for data_name, process_params in DATA_PARSER_PROCESSING.items():
-        template, formatter, process_info = process_params
-        parser = DataParser(data_name, template, formatter, process_info)
-        parser.process()
-        parser.emit(out_dir)
-        print('Saved {}{}'.format(data_name, EXT))
-
-    for data_name, process_params in DATABASE_BASED_PROCESSING.items():
-        parser = DatabaseBasedParser(data_name, process_params)
-        parser.process(out_dir)
-        print('Saved {}{}'.format(data_name, EXT))
-
-    for data_name, process_params in NON_TEMPLATE_PROCESSING.items():
-        parser = CustomDataParser(data_name, process_params)
-        parser.process(in_dir, out_dir)
-        print('Saved {}{}'.format(data_name, EXT))
-
     kv_out = out_dir+'/kv/'
     if not os.path.exists(kv_out):
         os.makedirs(kv_out)
-    for data_name, process_params in KV_PROCESSING.items():
-        template, formatter, process_info = process_params
-        parser = DataParser(data_name, template, formatter, process_info)
-        parser.process()
-        parser.emit(kv_out)
-        print('Saved kv/{}{}'.format(data_name, EXT))
+    run_info['setup_seconds'] = round(time.perf_counter() - run_start, 6)
+    runs = all_runs = processor_runs(out_dir)
+    if only or skip:
+        runs = select_processors(all_runs, only, skip)
+    if incremental:
+        fingerprint = manifest_fingerprint()
+        recorded = read_manifest(out_dir, fingerprint)
+        table_hash = table_hashes()
+        selected = runs
+        runs = select_changed(selected, recorded, out_dir, table_hash)
+        skipped = [name for name in selected if name not in runs]
+        if skipped:
+            print('Skipped {} unchanged: {}'.format(len(skipped), ', '.join(skipped)))
+    if workers > 1:
+        # Forks must only read, so nothing may be left to load lazily
+        if not ingest_workers:
+            mono_db.load_all(skip=TEXT_LABEL_TABLES)
+        for lang in TEXT_LABEL_DICT:
+            TEXT_LABEL_DICT[lang]
+        tables_read = run_scheduled(runs, workers, profiler, track=incremental)
+    else:
+        tables_read = {name: run_processor(name, run, track=incremental) for name, run in runs.items()}
+    CURRENT_PROCESSOR = None
+    if incremental:
+        processors = {}
+        for name in all_runs:
+            if name in tables_read:
+                processors[name] = {table: table_hash(table) for table in sorted(tables_read[name])}
+            elif name in recorded:
+                processors[name] = recorded[name]
+        write_manifest(out_dir, fingerprint, processors)
+        print('Reran {} of {} processors'.format(len(runs), len(all_runs)))
+
+    if profiler:
+        profiler.uninstall()
+        profiler.write(label_profile)
+        print('Saved label profile to {}'.format(label_profile))
+
+    if query_stats:
+        print_resolver_stats()
+        print_query_stats()
+    if trace_memory:
+        tracemalloc.stop()
+    if run_report:
+        print_run_report()
+        run_info['total_seconds'] = round(time.perf_counter() - run_start, 6)
+        write_run_report(run_report, run_info)
+        print('Saved run report to {}'.format(run_report))
+    if entity_catalog:
+        ENTITY_CATALOG.build()
+        ENTITY_CATALOG.write(entity_catalog)
+        print('Saved entity catalog to {}'.format(entity_catalog))
 
 
 if __name__ == '__main__':
@@ -2870,6 +4726,35 @@ if __name__ == '__main__':
     parser.add_argument('-o', type=str, help='directory of output text files  (default: ./output-data)', default='./output-data')
     parser.add_argument('-j', type=str, help='path to json file with ordering', default='')
     parser.add_argument('--delete_old', help='delete older output files', dest='delete_old', action='store_true')
+    parser.add_argument('--db', type=str, help='path to a persistent mono database, reused across runs (default: in-memory)', default=None)
+    parser.add_argument('--label_profile', type=str, help='write a JSON profile of label lookups per processor to this path', default=None)
+    parser.add_argument('--query_stats', help='print the most expensive database queries and the lookup cache hit rates of the run', dest='query_stats', action='store_true')
+    parser.add_argument('--workers', type=int, help='run independent processors concurrently in this many processes (default: 1, serially)', default=1)
+    parser.add_argument('--incremental', help='only rerun processors whose input tables changed since the last incremental run into the output directory', dest='incremental', action='store_true')
+    parser.add_argument('--run_report', type=str, help='write the time, rows, entities, bytes and queries of every processor to this JSON file', default=None)
+    parser.add_argument('--trace_memory', help='trace allocations with tracemalloc, adding the peak of each processor to the run report (slow)', dest='trace_memory', action='store_true')
+    parser.add_argument('--shard_workers', type=int, help='split the tables of row-independent processors (generic templates, key values, materials, skills) across this many processes', default=0)
+    parser.add_argument('--stream', help='write entities as they are processed instead of holding whole tables in memory', dest='stream', action='store_true')
+    parser.add_argument('--entity_catalog', type=str, help='write every entity rewards can name, with its icon, name and category, to this JSON file (.json) or SQLite database (otherwise)', default=None)
+    parser.add_argument('--only', type=str, help='comma separated processors to run, along with those they depend on (e.g. Weapons,kv/QuestData)', default=None)
+    parser.add_argument('--skip', type=str, help='comma separated processors not to run, unless one that is run depends on them', default=None)
+    parser.add_argument('--changelog', type=str, help='directory of an older dump to compare against, writing what changed per processor to <output>/changelog/', default=None)
+    parser.add_argument('--old_db', type=str, help='path to a persistent mono database for the --changelog dump', default=None)
+    parser.add_argument('--ingest_workers', type=int, help='load the whole mono dump up front with this many parser processes, instead of loading tables as they are queried', default=0)
 
     args = parser.parse_args()
-    process(input_dir=args.i, output_dir=args.o, ordering_data_path=args.j, delete_old=args.delete_old)
+    only = args.only and args.only.split(',')
+    skip = args.skip and args.skip.split(',')
+    try:
+        check_processors(processor_runs(args.o), only, skip)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.changelog:
+        # Each of these would only describe one of the two runs, or leave entities out of the comparison
+        unsupported = [option for option, value in (('--incremental', args.incremental), ('--label_profile', args.label_profile),
+                                                    ('--run_report', args.run_report), ('--entity_catalog', args.entity_catalog)) if value]
+        if unsupported:
+            parser.error('--changelog cannot be combined with {}'.format(', '.join(unsupported)))
+        process_changelog(args.changelog, input_dir=args.i, output_dir=args.o, old_db_path=args.old_db, db_path=args.db, ordering_data_path=args.j, delete_old=args.delete_old, ingest_workers=args.ingest_workers, workers=args.workers, only=only, skip=skip, query_stats=args.query_stats, trace_memory=args.trace_memory, shard_workers=args.shard_workers, stream=args.stream)
+    else:
+        process(input_dir=args.i, output_dir=args.o, ordering_data_path=args.j, delete_old=args.delete_old, db_path=args.db, ingest_workers=args.ingest_workers, workers=args.workers, incremental=args.incremental, only=only, skip=skip, query_stats=args.query_stats, label_profile=args.label_profile, run_report=args.run_report, trace_memory=args.trace_memory, shard_workers=args.shard_workers, stream=args.stream, entity_catalog=args.entity_catalog)